@@ -51,7 +51,10 @@ setup(
     ],
     extras_require={
         "LSA": ["numpy"],
-        "LexRank": ["numpy"],
+        "LexRank": ["numpy", "scipy"],
+        "SumBasic": ["numpy"],
+        "KL": ["numpy"],
+        "Reduction": ["numpy", "scipy"],
         "Japanese": ["tinysegmenter"],
         "Chinese": ["jieba"],
         "Korean": ["konlpy"],
@@ -5,3 +5,4 @@ from __future__ import division, print_function, unicode_literals
 
 
 from .tf import TfDocumentModel
+from .idf import IdfTable
@@ -4,5 +4,6 @@ from __future__ import absolute_import
 from __future__ import division, print_function, unicode_literals
 
 from ._document import ObjectDocumentModel
+from ._encoded_document import EncodedDocument
 from ._paragraph import Paragraph
 from ._sentence import Sentence
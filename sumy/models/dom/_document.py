@@ -4,14 +4,19 @@ from __future__ import absolute_import
 from __future__ import division, print_function, unicode_literals
 
 from itertools import chain
+from threading import Lock
 from ...utils import cached_property
 from ..._compat import unicode_compatible
+from ._encoded_document import EncodedDocument
 
 
 @unicode_compatible
 class ObjectDocumentModel(object):
     def __init__(self, paragraphs):
         self._paragraphs = tuple(paragraphs)
+        self._encoded_documents = {}
+        # guards building of the encoded views shared by the summarizers running in threads
+        self._encoding_lock = Lock()
 
     @property
     def paragraphs(self):
@@ -32,6 +37,35 @@ class ObjectDocumentModel(object):
         words = (p.words for p in self._paragraphs)
         return tuple(chain(*words))
 
+    def encode(self, stemmer):
+        """
+        Returns :class:`EncodedDocument` view of the document. Views are cached
+        by the stemmer so the summarizers sharing it normalize and stem the words
+        of the document only once, even when they run in threads. Stop-words
+        are applied by the summarizers on top of the shared view.
+        """
+        encoded_document = self._encoded_documents.get(stemmer)
+        if encoded_document is None:
+            with self._encoding_lock:
+                encoded_document = self._encoded_documents.get(stemmer)
+                if encoded_document is None:
+                    encoded_document = EncodedDocument(self, stemmer)
+                    self._encoded_documents[stemmer] = encoded_document
+
+        return encoded_document
+
+    def __getstate__(self):
+        # encoded views (with the stemmers) and the lock are not pickled nor copied
+        state = self.__dict__.copy()
+        del state["_encoded_documents"]
+        del state["_encoding_lock"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._encoded_documents = {}
+        self._encoding_lock = Lock()
+
     def __unicode__(self):
         return "<DOM with %d paragraphs>" % len(self.paragraphs)
 
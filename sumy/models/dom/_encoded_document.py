@@ -0,0 +1,137 @@
+# -*- coding: utf-8 -*-
+
+from __future__ import absolute_import
+from __future__ import division, print_function, unicode_literals
+
+from threading import Lock
+from ..._compat import to_unicode, unicode_compatible
+from ...nlp.stemmers import stem_many
+
+
+@unicode_compatible
+class EncodedDocument(object):
+    """
+    Integer-encoded view of the document shared by the summarizers using
+    the same stemmer. Words are normalized (lower-cased) and encoded by their
+    index in :attr:`words`. Every distinct word is normalized only once and
+    stemmed only once when the stems are needed for the first time. Stop-words
+    are applied on top of the view so it's shared by any set of them.
+    """
+
+    def __init__(self, document, stemmer, normalize_word=None):
+        """
+        :param document:
+            Document with sentences and (optional) headings.
+        :param stemmer:
+            Callable stemming the normalized words.
+        :param normalize_word:
+            Callable normalizing the words, :meth:`normalize_word` by default.
+        """
+        normalize_word = normalize_word or self.normalize_word
+        word_ids = {}
+        raw_word_ids = {}
+
+        def encode(sentence):
+            ids = []
+            for word in sentence.words:
+                word_id = raw_word_ids.get(word)
+                if word_id is None:
+                    word_id = word_ids.setdefault(normalize_word(word), len(word_ids))
+                    raw_word_ids[word] = word_id
+                ids.append(word_id)
+
+            return tuple(ids)
+
+        self._headings = tuple(encode(h) for h in getattr(document, "headings", ()))
+        self._sentences = tuple(encode(s) for s in document.sentences)
+        self._words = tuple(sorted(word_ids, key=word_ids.get))
+
+        self._stemmer = stemmer
+        self._stems = None
+        self._stem_ids = None
+        self._stems_lock = Lock()
+        self._stop_words_masks = {}
+
+    def _ensure_stems(self):
+        if self._stem_ids is not None:
+            return
+
+        with self._stems_lock:
+            if self._stem_ids is None:
+                # stems are published before their ids checked by the other threads
+                stem_ids = {}
+                ids = tuple(stem_ids.setdefault(s, len(stem_ids)) for s in stem_many(self._stemmer, self._words))
+                self._stems = tuple(sorted(stem_ids, key=stem_ids.get))
+                self._stem_ids = ids
+
+    @staticmethod
+    def normalize_word(word):
+        return to_unicode(word).lower()
+
+    @property
+    def headings(self):
+        """Tuple of word ids for every heading of the document."""
+        return self._headings
+
+    @property
+    def sentences(self):
+        """Tuple of word ids for every sentence of the document."""
+        return self._sentences
+
+    @property
+    def words(self):
+        """Normalized words, the word id is the index."""
+        return self._words
+
+    @property
+    def stems(self):
+        """Distinct stems, the stem id is the index."""
+        self._ensure_stems()
+        return self._stems
+
+    @property
+    def stem_ids(self):
+        """Stem id of every word."""
+        self._ensure_stems()
+        return self._stem_ids
+
+    def get_stop_words_mask(self, stop_words):
+        """Returns flag for every word telling if it's one of the given normalized stop-words."""
+        stop_words = frozenset(stop_words)
+        mask = self._stop_words_masks.get(stop_words)
+        if mask is None:
+            mask = tuple(w in stop_words for w in self._words)
+            mask = self._stop_words_masks.setdefault(stop_words, mask)
+
+        return mask
+
+    def get_words(self, word_ids, stop_words=None):
+        """Returns list of normalized words with the given ids that are not stop-words."""
+        if stop_words:
+            mask = self.get_stop_words_mask(stop_words)
+            return [self._words[i] for i in word_ids if not mask[i]]
+        return [self._words[i] for i in word_ids]
+
+    def get_stems(self, word_ids, stop_words=None):
+        """Returns list of stems of the words with the given ids that are not stop-words."""
+        stems, stem_ids = self.stems, self.stem_ids
+        if stop_words:
+            mask = self.get_stop_words_mask(stop_words)
+            return [stems[stem_ids[i]] for i in word_ids if not mask[i]]
+        return [stems[stem_ids[i]] for i in word_ids]
+
+    def __getstate__(self):
+        # the lock is not pickled nor copied
+        state = self.__dict__.copy()
+        del state["_stems_lock"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._stems_lock = Lock()
+
+    def __unicode__(self):
+        return "<EncodedDocument with %d words>" % len(self._words)
+
+    def __repr__(self):
+        return self.__str__()
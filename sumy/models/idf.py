@@ -0,0 +1,167 @@
+# -*- coding: utf-8 -*-
+
+from __future__ import absolute_import
+from __future__ import division, print_function, unicode_literals
+
+import math
+
+from bisect import bisect_left
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+from os import makedirs
+from os.path import join, isdir
+from collections import Counter
+from .._compat import to_unicode
+from ..nlp.stemmers import null_stemmer, stem_many
+
+
+class IdfTable(object):
+    """
+    Inverse document frequencies of terms computed once from a background
+    corpus. Sorted terms are stored as one buffer of concatenated UTF-8 bytes
+    split by array of offsets together with array of float32 IDF values so
+    the table may be memory-mapped from the disk and shared by many processes.
+    """
+    _TERMS_FILE = "terms.npy"
+    _OFFSETS_FILE = "offsets.npy"
+    _VALUES_FILE = "idf.npy"
+
+    def __init__(self, terms, offsets, values):
+        """
+        :param terms:
+            NumPy array of bytes (uint8) of the sorted UTF-8 encoded terms.
+        :param offsets:
+            NumPy array of the offsets of the terms in the ``terms`` buffer, the last
+            one is the end of the last term. The first term has to be the empty one
+            and holds the IDF of the terms missing in the corpus.
+        :param values:
+            NumPy array of IDF values of the terms.
+        """
+        self._ensure_dependencies_installed()
+        if len(offsets) - 1 != len(values):
+            raise ValueError("Count of terms (%d) and IDF values (%d) differs." % (len(offsets) - 1, len(values)))
+        if len(offsets) < 2 or offsets[0] != 0 or offsets[1] != 0:
+            raise ValueError("The first term has to be the empty one holding the default IDF value.")
+        if offsets[-1] != len(terms):
+            raise ValueError("The last offset (%d) has to be the size of the terms (%d)." % (offsets[-1], len(terms)))
+
+        self._terms = _Terms(terms, offsets)
+        self._values = values
+
+    @staticmethod
+    def _ensure_dependencies_installed():
+        if numpy is None:
+            raise ValueError("IDF table requires NumPy. Please, install it by command 'pip install numpy'.")
+
+    @classmethod
+    def from_documents(cls, documents, stemmer=null_stemmer, stop_words=()):
+        """
+        Builds the table from the corpus of documents. Words are normalized,
+        filtered and stemmed the same way as summarizers do it.
+
+        :param documents:
+            Iterable of documents (e.g. ``parser.document``) of the corpus.
+        :param stemmer:
+            Stemmer used also by the summarizer.
+        :param stop_words:
+            Stop-words used also by the summarizer.
+        """
+        cls._ensure_dependencies_installed()
+        stop_words = frozenset(cls.normalize_word(w) for w in stop_words)
+
+        documents_count = 0
+        document_frequencies = Counter()
+        for document in documents:
+            words = map(cls.normalize_word, document.words)
+            terms = frozenset(stem_many(stemmer, [w for w in words if w not in stop_words]))
+            document_frequencies.update(terms)
+            documents_count += 1
+
+        terms = sorted(to_unicode(t).encode("utf-8") for t in document_frequencies)
+        values = [math.log(documents_count / (1 + document_frequencies[t.decode("utf-8")])) for t in terms]
+
+        # IDF of the term missing in corpus
+        default_value = math.log(documents_count) if documents_count else 0.0
+        offsets = numpy.cumsum([0, 0] + [len(t) for t in terms], dtype=numpy.int64)
+        terms = numpy.frombuffer(b"".join(terms), dtype=numpy.uint8)
+        values = numpy.array([default_value] + values, dtype=numpy.float32)
+
+        return cls(terms, offsets, values)
+
+    @classmethod
+    def load(cls, path, mmap=True):
+        """Loads the table from the directory. The arrays are memory-mapped by default."""
+        cls._ensure_dependencies_installed()
+        mmap_mode = "r" if mmap else None
+        terms = numpy.load(join(path, cls._TERMS_FILE), mmap_mode=mmap_mode)
+        offsets = numpy.load(join(path, cls._OFFSETS_FILE), mmap_mode=mmap_mode)
+        values = numpy.load(join(path, cls._VALUES_FILE), mmap_mode=mmap_mode)
+
+        return cls(terms, offsets, values)
+
+    def save(self, path):
+        """Saves the table into the directory (created if missing)."""
+        if not isdir(path):
+            makedirs(path)
+
+        numpy.save(join(path, self._TERMS_FILE), self._terms.buffer)
+        numpy.save(join(path, self._OFFSETS_FILE), self._terms.offsets)
+        numpy.save(join(path, self._VALUES_FILE), self._values)
+
+    @staticmethod
+    def normalize_word(word):
+        return to_unicode(word).lower()
+
+    @property
+    def default_idf(self):
+        """IDF of the terms missing in the corpus."""
+        return float(self._values[0])
+
+    def _find_index(self, term):
+        """Returns index of the term found by binary search or 0 (the empty term) if it's missing."""
+        key = to_unicode(term).encode("utf-8")
+        index = bisect_left(self._terms, key)
+        return index if index < len(self._terms) and self._terms[index] == key else 0
+
+    def idf_metrics(self, terms):
+        """
+        Returns mapping key = term, value = IDF of the term
+        for all the given terms by one lookup of the values.
+        """
+        terms = list(terms)
+        if not terms:
+            return {}
+
+        indexes = numpy.array([self._find_index(t) for t in terms], dtype=numpy.intp)
+        return dict(zip(terms, self._values[indexes].tolist()))
+
+    def __getitem__(self, term):
+        return self.idf_metrics((term,))[term]
+
+    def __contains__(self, term):
+        return self._find_index(term) != 0
+
+    def __len__(self):
+        # the empty term is not counted
+        return len(self._terms) - 1
+
+    def __repr__(self):
+        return "<IdfTable with %d terms>" % len(self)
+
+
+class _Terms(object):
+    """Sorted sequence of UTF-8 encoded terms stored in one buffer split by offsets."""
+
+    def __init__(self, buffer, offsets):
+        self.buffer = buffer
+        self.offsets = offsets
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def __getitem__(self, index):
+        return self.buffer[self.offsets[index]:self.offsets[index + 1]].tobytes()
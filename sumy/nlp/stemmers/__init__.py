@@ -5,6 +5,9 @@ from __future__ import division, print_function, unicode_literals
 
 import nltk.stem.snowball as nltk_stemmers_module
 
+from collections import namedtuple, OrderedDict
+from threading import Lock
+
 from .czech import stem_word as czech_stemmer
 from .ukrainian import stem_word as ukrainian_stemmer
 from .greek import stem_word as greek_stemmer
@@ -18,6 +21,32 @@ def null_stemmer(object):
     return to_unicode(object).lower()
 
 
+def stem_many(stemmer, words):
+    """
+    Returns list of stems of the given words. Every distinct word is stemmed
+    only once. Stemmers without their own ``stem_many`` method (any callable
+    like :func:`null_stemmer`) are supported too.
+    """
+    method = getattr(stemmer, "stem_many", None)
+    if method is not None:
+        return method(words)
+
+    return _stem_distinct_words(stemmer, words)
+
+
+def _stem_distinct_words(stemmer, words):
+    words = tuple(words)
+    stems = {}
+    for word in words:
+        if word not in stems:
+            stems[word] = stemmer(word)
+
+    return [stems[w] for w in words]
+
+
+StemmerCacheInfo = namedtuple("StemmerCacheInfo", ("hits", "misses", "maxsize", "currsize",))
+
+
 class Stemmer(object):
     SPECIAL_STEMMERS = {
         'czech': czech_stemmer,
@@ -30,7 +59,24 @@ class Stemmer(object):
         'greek': greek_stemmer,
     }
 
-    def __init__(self, language):
+    def __init__(self, language, cache_size=0):
+        """
+        :param str language:
+            Language of the stemmed words.
+        :param int cache_size:
+            Number of the most recently stemmed words remembered with their stems.
+            The cache is shared by all the threads using the stemmer. Zero disables it.
+        """
+        if cache_size < 0:
+            raise ValueError("Size of the cache has to be non-negative, got %r." % cache_size)
+
+        self._cache_size = cache_size
+        self._cache = OrderedDict()
+        # the lock is created only for the enabled cache
+        self._cache_lock = Lock() if cache_size else None
+        self._hits = 0
+        self._misses = 0
+
         language = normalize_language(language)
         self._stemmer = null_stemmer
         if language.lower() in self.SPECIAL_STEMMERS:
@@ -44,4 +90,47 @@ class Stemmer(object):
         self._stemmer = stemmer_class().stem
 
     def __call__(self, word):
-        return self._stemmer(word)
+        if not self._cache_size:
+            return self._stemmer(word)
+
+        with self._cache_lock:
+            stem = self._cache.pop(word, None)
+            if stem is not None:
+                # the most recently used word is moved to the end
+                self._cache[word] = stem
+                self._hits += 1
+                return stem
+            self._misses += 1
+
+        stem = self._stemmer(word)
+        with self._cache_lock:
+            self._cache[word] = stem
+            while len(self._cache) > self._cache_size:
+                self._cache.popitem(last=False)
+
+        return stem
+
+    def stem_many(self, words):
+        """
+        Returns list of stems of the given words. Every distinct word
+        is stemmed only once and the stems are mapped back to the words.
+        """
+        return _stem_distinct_words(self, words)
+
+    def cache_info(self):
+        """Returns hits, misses, maximal and current size of the cache."""
+        if not self._cache_size:
+            return StemmerCacheInfo(0, 0, 0, 0)
+
+        with self._cache_lock:
+            return StemmerCacheInfo(self._hits, self._misses, self._cache_size, len(self._cache))
+
+    def cache_clear(self):
+        """Clears the cache and its statistics."""
+        if not self._cache_size:
+            return
+
+        with self._cache_lock:
+            self._cache.clear()
+            self._hits = 0
+            self._misses = 0
@@ -0,0 +1,110 @@
+# -*- coding: utf-8 -*-
+
+from __future__ import absolute_import
+from __future__ import division, print_function, unicode_literals
+
+from collections import namedtuple
+from timeit import default_timer
+from warnings import warn
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+try:
+    # kernels of SciPy writing products of sparse matrix and vector into the given buffer
+    from scipy.sparse._sparsetools import csc_matvec, csr_matvec
+except ImportError:
+    csc_matvec = csr_matvec = None
+
+
+PowerMethodReport = namedtuple("PowerMethodReport", ("iterations", "residual", "elapsed_time", "converged",))
+
+
+def power_iteration(matrix, epsilon, max_iterations=None, initial_vector=None, normalize=False, damping=None):
+    """
+    Computes stationary vector of the given matrix by power method.
+
+    :param matrix:
+        Square NumPy array or SciPy sparse matrix.
+    :param float epsilon:
+        Iteration stops when the norm of the difference between two consecutive vectors is not greater.
+    :param int max_iterations:
+        Iteration stops after this number of iterations even if it didn't converge. Value ``None`` means no limit.
+    :param initial_vector:
+        Vector to start with (warm start). Uniform vector is used by default.
+    :param bool normalize:
+        Normalizes vector to unit length after every iteration.
+    :param float damping:
+        Damping factor of PageRank-like iteration. The uniform teleport term is applied implicitly
+        so the given (sparse) matrix ``W`` behaves like dense ``(1 - damping)/N + damping*W``.
+    :returns pair:
+        Tuple with the stationary vector and :class:`PowerMethodReport`.
+    """
+    start_time = default_timer()
+    transposed_matrix = matrix.T
+    sentences_count = matrix.shape[0]
+
+    # dense matrix of any memory layout and type is multiplied into float64 buffer directly
+    is_dense = isinstance(transposed_matrix, numpy.ndarray)
+    if not is_dense and transposed_matrix.dtype != numpy.float64:
+        transposed_matrix = transposed_matrix.astype(numpy.float64)
+
+    if initial_vector is None:
+        p_vector = numpy.full(sentences_count, 1.0 / sentences_count)
+    else:
+        p_vector = numpy.array(initial_vector, dtype=numpy.float64)
+        if p_vector.shape != (sentences_count,):
+            raise ValueError("Initial vector has to have %d items, got shape %r." % (sentences_count, p_vector.shape))
+
+    # buffers reused by all iterations
+    next_p = numpy.empty_like(p_vector)
+    difference = numpy.empty_like(p_vector)
+
+    iterations = 0
+    lambda_val = 1.0
+    while lambda_val > epsilon:
+        if max_iterations is not None and iterations >= max_iterations:
+            break
+
+        if is_dense:
+            numpy.dot(transposed_matrix, p_vector, out=next_p)
+        else:
+            _sparse_dot(transposed_matrix, p_vector, next_p)
+
+        if damping is not None:
+            next_p *= damping
+            next_p += (1.0 - damping) * p_vector.sum() / sentences_count
+
+        if normalize:
+            next_p /= numpy.linalg.norm(next_p)
+
+        numpy.subtract(next_p, p_vector, out=difference)
+        lambda_val = numpy.linalg.norm(difference)
+        p_vector, next_p = next_p, p_vector
+        iterations += 1
+
+    converged = bool(lambda_val <= epsilon)
+    if not converged:
+        warn("Power method didn't converge in %d iterations (residual %g)." % (iterations, lambda_val))
+
+    report = PowerMethodReport(iterations, float(lambda_val), default_timer() - start_time, converged)
+    return p_vector, report
+
+
+def _sparse_dot(matrix, vector, out):
+    """
+    Writes product of the sparse matrix and the vector into the ``out`` buffer.
+    Matrices in other formats than CSR/CSC (or without the SciPy kernels)
+    allocate their product and it's copied into the buffer.
+    """
+    sparse_format = getattr(matrix, "format", None)
+    if sparse_format == "csr" and csr_matvec is not None:
+        out.fill(0.0)
+        csr_matvec(matrix.shape[0], matrix.shape[1], matrix.indptr, matrix.indices, matrix.data, vector, out)
+    elif sparse_format == "csc" and csc_matvec is not None:
+        out.fill(0.0)
+        csc_matvec(matrix.shape[0], matrix.shape[1], matrix.indptr, matrix.indices, matrix.data, vector, out)
+    else:
+        out[:] = matrix.dot(vector)
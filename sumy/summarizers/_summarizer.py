@@ -4,14 +4,22 @@ from __future__ import absolute_import
 from __future__ import division, print_function, unicode_literals
 
 
+import heapq
+
 from collections import namedtuple
+from itertools import chain
 from operator import attrgetter
 from ..utils import ItemsCount
 from .._compat import to_unicode
-from ..nlp.stemmers import null_stemmer
+from ..nlp.stemmers import null_stemmer, stem_many
+from ..models.dom import EncodedDocument
 
 
 SentenceInfo = namedtuple("SentenceInfo", ("sentence", "order", "rating",))
+# rating of the sentences not ranked by greedy summarizers stopped early
+UNRANKED_RATING = float("-inf")
+# prefix of the modules with the default processing of the words
+_SUMY_PACKAGE = __name__.split(".")[0] + "."
 
 
 class AbstractSummarizer(object):
@@ -27,10 +35,82 @@ class AbstractSummarizer(object):
     def stem_word(self, word):
         return self._stemmer(self.normalize_word(word))
 
+    def stem_words(self, words):
+        """Returns stems of the given words. Every distinct word is stemmed only once."""
+        if self._is_overridden("stem_word"):
+            return [self.stem_word(w) for w in words]
+
+        return stem_many(self._stemmer, map(self.normalize_word, words))
+
     @staticmethod
     def normalize_word(word):
         return to_unicode(word).lower()
 
+    def _is_overridden(self, method_name):
+        """
+        Returns ``True`` if the method processing the words was overridden
+        by a subclass defined outside of sumy.
+        """
+        for cls in type(self).__mro__:
+            if method_name in vars(cls):
+                return not cls.__module__.startswith(_SUMY_PACKAGE)
+
+        return False
+
+    def _get_encoded_document(self, document):
+        """
+        Returns encoded view of the document shared by the summarizers with the same
+        stemmer. Documents without the cache of the views (any other object than
+        :class:`ObjectDocumentModel`) are encoded by every summarizer again.
+        Summarizers overriding :meth:`normalize_word` or :meth:`stem_word` get
+        their own view built by these methods.
+        """
+        if self._is_overridden("normalize_word") or self._is_overridden("stem_word"):
+            return EncodedDocument(document, self.stem_word, self.normalize_word)
+        if hasattr(document, "encode"):
+            return document.encode(self._stemmer)
+
+        return EncodedDocument(document, self._stemmer)
+
+    def _stem_sentences(self, document, headings=True):
+        """
+        Returns mapping sentence -> tuple of stems of its words for all
+        the sentences of the document. Headings are included only if ``headings`` is true.
+        """
+        encoded_document = self._get_encoded_document(document)
+        sentences, word_ids = document.sentences, encoded_document.sentences
+        if headings:
+            sentences = chain(getattr(document, "headings", ()), sentences)
+            word_ids = chain(encoded_document.headings, word_ids)
+
+        return dict((s, tuple(encoded_document.get_stems(ids))) for s, ids in zip(sentences, word_ids))
+
+    def _stem_content_words(self, document, stop_words):
+        """
+        Returns list of stems of the words that are not stop-words for every sentence
+        of the document. Stems come from the encoded view of the document shared
+        by the summarizers with the same stemmer unless the summarizer overrides
+        its method ``_to_words_set`` processing the words of the sentence.
+        """
+        if self._is_overridden("_to_words_set"):
+            return [self._to_words_set(s) for s in document.sentences]
+
+        encoded_document = self._get_encoded_document(document)
+        return [encoded_document.get_stems(ids, stop_words) for ids in encoded_document.sentences]
+
+    @staticmethod
+    def _get_items_count(count, items_count):
+        """
+        Returns number of items selected by ``count`` from ``items_count`` items
+        or ``None`` if it's not known in advance (custom callable ``count``).
+        """
+        if not callable(count):
+            count = ItemsCount(count)
+        elif not isinstance(count, ItemsCount):
+            return None
+
+        return len(count(range(items_count)))
+
     @staticmethod
     def _get_best_sentences(sentences, count, rating, *args, **kwargs):
         rate = rating
@@ -38,16 +118,21 @@ class AbstractSummarizer(object):
             assert not args and not kwargs
             def rate(s): return rating[s]
 
-        infos = (SentenceInfo(s, o, rate(s, *args, **kwargs))
-            for o, s in enumerate(sentences))
+        sentences = tuple(sentences)
+        ratings = [rate(s, *args, **kwargs) for s in sentences]
 
-        # sort sentences by rating in descending order
-        infos = sorted(infos, key=attrgetter("rating"), reverse=True)
-        # get `count` first best rated sentences
-        if not callable(count):
-            count = ItemsCount(count)
-        infos = count(infos)
+        items_count = AbstractSummarizer._get_items_count(count, len(sentences))
+        if items_count is None:
+            infos = (SentenceInfo(s, o, r) for o, (s, r) in enumerate(zip(sentences, ratings)))
+            # sort sentences by rating in descending order
+            infos = sorted(infos, key=attrgetter("rating"), reverse=True)
+            # get `count` first best rated sentences
+            orders = [i.order for i in count(infos)]
+        else:
+            # the same as sorting and slicing (ties keep document order) but only
+            # `items_count` best rated sentences are kept in the heap
+            orders = heapq.nlargest(items_count, range(len(sentences)), key=ratings.__getitem__)
         # sort sentences by their order in document
-        infos = sorted(infos, key=attrgetter("order"))
+        orders = sorted(orders)
 
-        return tuple(i.sentence for i in infos)
+        return tuple(sentences[o] for o in orders)
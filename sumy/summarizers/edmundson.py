@@ -3,7 +3,11 @@
 from __future__ import absolute_import
 from __future__ import division, print_function, unicode_literals
 
-from collections import defaultdict
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
 from ..nlp.stemmers import null_stemmer
 from ._summarizer import AbstractSummarizer
 from .edmundson_cue import EdmundsonCueMethod
@@ -19,6 +23,9 @@ class EdmundsonSummarizer(AbstractSummarizer):
     _bonus_words = _EMPTY_SET
     _stigma_words = _EMPTY_SET
     _null_words = _EMPTY_SET
+    # multiply the ratings of the methods by their weights, by default
+    # the positive weights only switch the methods on
+    weighted = False
 
     def __init__(self, stemmer=null_stemmer, cue_weight=1.0, key_weight=0.0,
             title_weight=1.0, location_weight=1.0):
@@ -43,7 +50,7 @@ class EdmundsonSummarizer(AbstractSummarizer):
 
     @bonus_words.setter
     def bonus_words(self, collection):
-        self._bonus_words = frozenset(map(self.stem_word, collection))
+        self._bonus_words = frozenset(self.stem_words(collection))
 
     @property
     def stigma_words(self):
@@ -51,7 +58,7 @@ class EdmundsonSummarizer(AbstractSummarizer):
 
     @stigma_words.setter
     def stigma_words(self, collection):
-        self._stigma_words = frozenset(map(self.stem_word, collection))
+        self._stigma_words = frozenset(self.stem_words(collection))
 
     @property
     def null_words(self):
@@ -59,33 +66,92 @@ class EdmundsonSummarizer(AbstractSummarizer):
 
     @null_words.setter
     def null_words(self, collection):
-        self._null_words = frozenset(map(self.stem_word, collection))
+        self._null_words = frozenset(self.stem_words(collection))
 
     def __call__(self, document, sentences_count):
-        ratings = defaultdict(int)
-
-        if self._cue_weight > 0.0:
-            method = self._build_cue_method_instance()
-            ratings = self._update_ratings(ratings, method.rate_sentences(document))
-        if self._key_weight > 0.0:
-            method = self._build_key_method_instance()
-            ratings = self._update_ratings(ratings, method.rate_sentences(document))
-        if self._title_weight > 0.0:
-            method = self._build_title_method_instance()
-            ratings = self._update_ratings(ratings, method.rate_sentences(document))
-        if self._location_weight > 0.0:
-            method = self._build_location_method_instance()
-            ratings = self._update_ratings(ratings, method.rate_sentences(document))
-
-        return self._get_best_sentences(document.sentences, sentences_count, ratings)
-
-    def _update_ratings(self, ratings, new_ratings):
-        assert len(ratings) == 0 or len(ratings) == len(new_ratings)
-
-        for sentence, rating in new_ratings.items():
-            ratings[sentence] += rating
-
-        return ratings
+        sentences = document.sentences
+        weights = (self._cue_weight, self._key_weight, self._title_weight, self._location_weight)
+        methods_ratings = self._rate_sentences_by_methods(document, [w > 0.0 for w in weights])
+
+        ratings = [0.0] * len(sentences)
+        for weight, method_ratings in zip(weights, methods_ratings):
+            if method_ratings is None:
+                continue
+            if self.weighted:
+                ratings = [r + weight*m for r, m in zip(ratings, method_ratings)]
+            else:
+                ratings = [r + m for r, m in zip(ratings, method_ratings)]
+
+        return self._get_best_sentences(sentences, sentences_count, dict(zip(sentences, ratings)))
+
+    def sweep_weights(self, document, sentences_count, weights, weighted=None):
+        """
+        Summarizes the document for many combinations of weights at once. Every method
+        rates the sentences only once and the ratings of all the combinations are
+        computed by one product of the matrix |sentences|×4 of the ratings and the matrix
+        4×|combinations| of the weights. Summary of every combination matches the one
+        returned by the summarizer created with the weights of the combination, but
+        the ratings are summed in a different order so sentences with almost the same
+        rating may be picked differently.
+
+        :param weights:
+            Sequence of tuples ``(cue_weight, key_weight, title_weight, location_weight)``.
+        :param bool weighted:
+            Multiplies the ratings of the methods by the weights. Otherwise the weights
+            have to be 0 or 1 and only switch the methods on. Attribute ``weighted``
+            of the summarizer is used by default.
+        :returns list:
+            Summary (tuple of sentences) for every combination of weights.
+        """
+        self._ensure_dependencies_installed()
+        weights = numpy.array(weights, dtype=numpy.float64)
+        if weights.ndim != 2 or weights.shape[1] != 4:
+            raise ValueError("Weights have to be sequence of 4-tuples (cue, key, title, location), got shape %r." % (weights.shape,))
+        self._ensure_correct_weights(*weights.ravel())
+
+        weighted = self.weighted if weighted is None else weighted
+        if not weighted and not numpy.all((weights == 0.0) | (weights == 1.0)):
+            raise ValueError("Weights of not weighted methods have to be 0 or 1, use 'weighted=True' to multiply the ratings by them.")
+
+        sentences = document.sentences
+        methods_ratings = numpy.zeros((len(sentences), 4))
+        for index, method_ratings in enumerate(self._rate_sentences_by_methods(document, weights.max(axis=0) > 0.0)):
+            if method_ratings is not None:
+                methods_ratings[:, index] = method_ratings
+
+        ratings = methods_ratings.dot(weights.T)
+        return [self._get_best_sentences(sentences, sentences_count, dict(zip(sentences, r)))
+            for r in ratings.T.tolist()]
+
+    def _ensure_dependencies_installed(self):
+        if numpy is None:
+            raise ValueError("Sweeping weights of Edmundson summarizer requires NumPy. Please, install it by command 'pip install numpy'.")
+
+    def _rate_sentences_by_methods(self, document, enabled):
+        """
+        Returns lists of ratings of the document sentences by the cue, key, title and location
+        methods. Only the enabled methods are run, ratings of the others are ``None``.
+        Words of the document are stemmed once and the stems are shared by the methods.
+        Stems of the headings are needed only by the key, title and location methods.
+        """
+        sentences = document.sentences
+        stems = self._stem_sentences(document, headings=any(enabled[1:]))
+        builders = (
+            self._build_cue_method_instance,
+            self._build_key_method_instance,
+            self._build_title_method_instance,
+            self._build_location_method_instance,
+        )
+
+        methods_ratings = []
+        for build_method, is_enabled in zip(builders, enabled):
+            if is_enabled:
+                ratings = build_method().rate_sentences(document, stems=stems)
+                methods_ratings.append([ratings[s] for s in sentences])
+            else:
+                methods_ratings.append(None)
+
+        return methods_ratings
 
     def cue_method(self, document, sentences_count, bonus_word_value=1, stigma_word_value=1):
         summarization_method = self._build_cue_method_instance()
@@ -13,13 +13,12 @@ class EdmundsonCueMethod(AbstractSummarizer):
         self._stigma_words = stigma_words
 
     def __call__(self, document, sentences_count, bonus_word_weight, stigma_word_weight):
-        return self._get_best_sentences(document.sentences,
-            sentences_count, self._rate_sentence, bonus_word_weight,
-            stigma_word_weight)
+        ratings = self.rate_sentences(document, bonus_word_weight, stigma_word_weight)
+        return self._get_best_sentences(document.sentences, sentences_count, ratings)
 
-    def _rate_sentence(self, sentence, bonus_word_weight, stigma_word_weight):
+    def _rate_sentence(self, sentence, bonus_word_weight, stigma_word_weight, stems=None):
         # count number of bonus/stigma words in sentence
-        words = map(self.stem_word, sentence.words)
+        words = self.stem_words(sentence.words) if stems is None else stems[sentence]
         bonus_words_count, stigma_words_count = self._count_words(words)
 
         # compute positive & negative rating
@@ -49,6 +48,13 @@ class EdmundsonCueMethod(AbstractSummarizer):
 
         return bonus_words_count, stigma_words_count
 
-    def rate_sentences(self, document, bonus_word_weight=1, stigma_word_weight=1):
+    def rate_sentences(self, document, bonus_word_weight=1, stigma_word_weight=1, stems=None):
+        """
+        :param dict stems:
+            Precomputed mapping sentence -> stems of its words shared by the methods.
+        """
+        if stems is None:
+            stems = self._stem_sentences(document, headings=False)
+
         return {sentence: self._rate_sentence(sentence, bonus_word_weight,
-                stigma_word_weight) for sentence in document.sentences}
+                stigma_word_weight, stems) for sentence in document.sentences}
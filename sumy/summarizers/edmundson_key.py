@@ -4,6 +4,7 @@ from __future__ import absolute_import
 from __future__ import division, print_function, unicode_literals
 
 from collections import Counter
+from itertools import chain
 from ._summarizer import AbstractSummarizer
 
 
@@ -13,14 +14,15 @@ class EdmundsonKeyMethod(AbstractSummarizer):
         self._bonus_words = bonus_words
 
     def __call__(self, document, sentences_count, weight):
-        significant_words = self._compute_significant_words(document, weight)
+        ratings = self.rate_sentences(document, weight)
+        return self._get_best_sentences(document.sentences, sentences_count, ratings)
 
-        return self._get_best_sentences(document.sentences,
-            sentences_count, self._rate_sentence, significant_words)
-
-    def _compute_significant_words(self, document, weight):
+    def _compute_significant_words(self, document, weight, stems=None):
         # keep only stems contained in bonus words
-        words = map(self.stem_word, document.words)
+        if stems is None:
+            words = self.stem_words(document.words)
+        else:
+            words = chain(*(stems[s] for s in chain(document.headings, document.sentences)))
         words = filter(self._is_bonus_word, words)
 
         # compute frequencies of bonus words in document
@@ -39,16 +41,22 @@ class EdmundsonKeyMethod(AbstractSummarizer):
     def _is_bonus_word(self, word):
         return word in self._bonus_words
 
-    def _rate_sentence(self, sentence, significant_words):
-        words = map(self.stem_word, sentence.words)
+    def _rate_sentence(self, sentence, significant_words, stems=None):
+        words = self.stem_words(sentence.words) if stems is None else stems[sentence]
         return sum(w in significant_words for w in words)
 
-    def rate_sentences(self, document, weight=0.5):
-        significant_words = self._compute_significant_words(document, weight)
+    def rate_sentences(self, document, weight=0.5, stems=None):
+        """
+        :param dict stems:
+            Precomputed mapping sentence -> stems of its words shared by the methods.
+        """
+        if stems is None:
+            stems = self._stem_sentences(document)
+        significant_words = self._compute_significant_words(document, weight, stems)
 
         rated_sentences = {}
         for sentence in document.sentences:
             rated_sentences[sentence] = self._rate_sentence(sentence,
-                significant_words)
+                significant_words, stems)
 
         return rated_sentences
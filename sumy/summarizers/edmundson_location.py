@@ -15,17 +15,17 @@ class EdmundsonLocationMethod(AbstractSummarizer):
         self._null_words = null_words
 
     def __call__(self, document, sentences_count, w_h, w_p1, w_p2, w_s1, w_s2):
-        significant_words = self._compute_significant_words(document)
-        ratings = self._rate_sentences(document, significant_words, w_h, w_p1,
-            w_p2, w_s1, w_s2)
-
+        ratings = self.rate_sentences(document, w_h, w_p1, w_p2, w_s1, w_s2)
         return self._get_best_sentences(document.sentences, sentences_count, ratings)
 
-    def _compute_significant_words(self, document):
+    def _compute_significant_words(self, document, stems=None):
         headings = document.headings
 
-        significant_words = chain(*map(attrgetter("words"), headings))
-        significant_words = map(self.stem_word, significant_words)
+        if stems is None:
+            significant_words = chain(*map(attrgetter("words"), headings))
+            significant_words = self.stem_words(significant_words)
+        else:
+            significant_words = chain(*(stems[h] for h in headings))
         significant_words = ffilter(self._is_null_word, significant_words)
 
         return frozenset(significant_words)
@@ -33,14 +33,14 @@ class EdmundsonLocationMethod(AbstractSummarizer):
     def _is_null_word(self, word):
         return word in self._null_words
 
-    def _rate_sentences(self, document, significant_words, w_h, w_p1, w_p2, w_s1, w_s2):
+    def _rate_sentences(self, document, significant_words, w_h, w_p1, w_p2, w_s1, w_s2, stems=None):
         rated_sentences = {}
         paragraphs = document.paragraphs
 
         for paragraph_order, paragraph in enumerate(paragraphs):
             sentences = paragraph.sentences
             for sentence_order, sentence in enumerate(sentences):
-                rating = self._rate_sentence(sentence, significant_words)
+                rating = self._rate_sentence(sentence, significant_words, stems)
                 rating *= w_h
 
                 if paragraph_order == 0:
@@ -57,10 +57,16 @@ class EdmundsonLocationMethod(AbstractSummarizer):
 
         return rated_sentences
 
-    def _rate_sentence(self, sentence, significant_words):
-        words = map(self.stem_word, sentence.words)
+    def _rate_sentence(self, sentence, significant_words, stems=None):
+        words = self.stem_words(sentence.words) if stems is None else stems[sentence]
         return sum(w in significant_words for w in words)
 
-    def rate_sentences(self, document, w_h=1, w_p1=1, w_p2=1, w_s1=1, w_s2=1):
-        significant_words = self._compute_significant_words(document)
-        return self._rate_sentences(document, significant_words, w_h, w_p1, w_p2, w_s1, w_s2)
+    def rate_sentences(self, document, w_h=1, w_p1=1, w_p2=1, w_s1=1, w_s2=1, stems=None):
+        """
+        :param dict stems:
+            Precomputed mapping sentence -> stems of its words shared by the methods.
+        """
+        if stems is None:
+            stems = self._stem_sentences(document)
+        significant_words = self._compute_significant_words(document, stems)
+        return self._rate_sentences(document, significant_words, w_h, w_p1, w_p2, w_s1, w_s2, stems)
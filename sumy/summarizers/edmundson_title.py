@@ -15,17 +15,15 @@ class EdmundsonTitleMethod(AbstractSummarizer):
         self._null_words = null_words
 
     def __call__(self, document, sentences_count):
-        sentences = document.sentences
-        significant_words = self._compute_significant_words(document)
-
-        return self._get_best_sentences(sentences, sentences_count,
-            self._rate_sentence, significant_words)
-
-    def _compute_significant_words(self, document):
-        heading_words = map(attrgetter("words"), document.headings)
-
-        significant_words = chain(*heading_words)
-        significant_words = map(self.stem_word, significant_words)
+        ratings = self.rate_sentences(document)
+        return self._get_best_sentences(document.sentences, sentences_count, ratings)
+
+    def _compute_significant_words(self, document, stems=None):
+        if stems is None:
+            heading_words = map(attrgetter("words"), document.headings)
+            significant_words = self.stem_words(chain(*heading_words))
+        else:
+            significant_words = chain(*(stems[h] for h in document.headings))
         significant_words = ffilter(self._is_null_word, significant_words)
 
         return frozenset(significant_words)
@@ -33,16 +31,22 @@ class EdmundsonTitleMethod(AbstractSummarizer):
     def _is_null_word(self, word):
         return word in self._null_words
 
-    def _rate_sentence(self, sentence, significant_words):
-        words = map(self.stem_word, sentence.words)
+    def _rate_sentence(self, sentence, significant_words, stems=None):
+        words = self.stem_words(sentence.words) if stems is None else stems[sentence]
         return sum(w in significant_words for w in words)
 
-    def rate_sentences(self, document):
-        significant_words = self._compute_significant_words(document)
+    def rate_sentences(self, document, stems=None):
+        """
+        :param dict stems:
+            Precomputed mapping sentence -> stems of its words shared by the methods.
+        """
+        if stems is None:
+            stems = self._stem_sentences(document)
+        significant_words = self._compute_significant_words(document, stems)
 
         rated_sentences = {}
         for sentence in document.sentences:
             rated_sentences[sentence] = self._rate_sentence(sentence,
-                significant_words)
+                significant_words, stems)
 
         return rated_sentences
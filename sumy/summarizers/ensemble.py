@@ -0,0 +1,138 @@
+# -*- coding: utf-8 -*-
+
+from __future__ import absolute_import
+from __future__ import division, print_function, unicode_literals
+
+from itertools import groupby
+from multiprocessing.pool import ThreadPool
+from ._summarizer import AbstractSummarizer, UNRANKED_RATING
+
+
+class EnsembleSummarizer(AbstractSummarizer):
+    """
+    Combines the rankings of the sentences by several summarizers into one.
+    Summarizers sharing the stemmer instance share also the encoded view
+    of the document (with any stop-words) so its words are stemmed only once.
+    """
+
+    FUSIONS = ("borda", "score",)
+    # "borda" sums the points for the positions of the sentence in the rankings,
+    # "score" sums the ratings of the summarizers scaled into the interval [0, 1]
+    fusion = "borda"
+    # number of threads running the summarizers in parallel
+    workers = 1
+
+    def __init__(self, summarizers, weights=None):
+        """
+        :param summarizers:
+            Sequence of configured summarizers.
+        :param weights:
+            Weight of the ranking of every summarizer. All of them have the same weight by default.
+        """
+        super(EnsembleSummarizer, self).__init__()
+
+        summarizers = tuple(summarizers)
+        if not summarizers:
+            raise ValueError("Ensemble requires at least one summarizer.")
+        if not all(callable(s) for s in summarizers):
+            raise ValueError("Summarizers have to be callable objects.")
+
+        weights = (1.0,) * len(summarizers) if weights is None else tuple(map(float, weights))
+        if len(weights) != len(summarizers):
+            raise ValueError("Expected %d weights (one for every summarizer), got %d." % (len(summarizers), len(weights)))
+        if any(w < 0.0 for w in weights):
+            raise ValueError("Negative weights are not allowed.")
+
+        self._summarizers = summarizers
+        self._weights = weights
+
+    @property
+    def summarizers(self):
+        return self._summarizers
+
+    @property
+    def weights(self):
+        return self._weights
+
+    def __call__(self, document, sentences_count):
+        ratings = iter(self.rate_sentences(document))
+        return self._get_best_sentences(document.sentences, sentences_count,
+            lambda s: next(ratings))
+
+    def _ensure_correct_fusion(self):
+        if self.fusion not in self.FUSIONS:
+            raise ValueError("Unknown fusion '%s'. Choose one of: %s." % (self.fusion, ", ".join(self.FUSIONS)))
+
+    def rate_sentences(self, document):
+        """Returns list of the fused ratings of the sentences in the order of the document."""
+        self._ensure_correct_fusion()
+
+        fuse = self._compute_borda_points if self.fusion == "borda" else self._normalize_ratings
+        ratings = [0.0] * len(document.sentences)
+        for weight, summarizer_ratings in zip(self._weights, self._rate_sentences_by_summarizers(document)):
+            for index, rating in enumerate(fuse(summarizer_ratings)):
+                ratings[index] += weight * rating
+
+        return ratings
+
+    def _rate_sentences_by_summarizers(self, document):
+        def rate_sentences(summarizer):
+            return self._rate_sentences_by(summarizer, document)
+
+        if self.workers > 1 and len(self._summarizers) > 1:
+            pool = ThreadPool(min(self.workers, len(self._summarizers)))
+            try:
+                return pool.map(rate_sentences, self._summarizers)
+            finally:
+                pool.close()
+                pool.join()
+        else:
+            return [rate_sentences(s) for s in self._summarizers]
+
+    @staticmethod
+    def _rate_sentences_by(summarizer, document):
+        """
+        Returns ratings of the sentences given by the summarizer. The custom callable
+        count gets all the rated sentences so the greedy summarizers rate all of them.
+        """
+        ratings = [UNRANKED_RATING] * len(document.sentences)
+
+        def collect_ratings(infos):
+            for info in infos:
+                ratings[info.order] = info.rating
+            return ()
+
+        summarizer(document, collect_ratings)
+        return ratings
+
+    @staticmethod
+    def _compute_borda_points(ratings):
+        """
+        The best rated sentence gets ``len(ratings) - 1`` points and the worst one
+        gets zero points. Sentences with the same rating share the average points.
+        """
+        points = [0.0] * len(ratings)
+        order = sorted(range(len(ratings)), key=ratings.__getitem__, reverse=True)
+
+        position = 0
+        for _, indexes in groupby(order, key=ratings.__getitem__):
+            indexes = list(indexes)
+            value = len(ratings) - 1 - position - (len(indexes) - 1) / 2
+            for index in indexes:
+                points[index] = value
+            position += len(indexes)
+
+        return points
+
+    @staticmethod
+    def _normalize_ratings(ratings):
+        """Scales the ratings into the interval [0, 1]. Unranked sentences get zero."""
+        finite_ratings = [r for r in ratings if UNRANKED_RATING < r < float("inf")]
+        if not finite_ratings:
+            return [0.0] * len(ratings)
+
+        minimum, maximum = min(finite_ratings), max(finite_ratings)
+        if minimum == maximum:
+            return [0.0 if r == UNRANKED_RATING else 1.0 for r in ratings]
+
+        return [min(max((r - minimum) / (maximum - minimum), 0.0), 1.0) for r in ratings]
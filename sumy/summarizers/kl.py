@@ -5,7 +5,12 @@ from __future__ import division, print_function, unicode_literals
 
 import math
 
-from ._summarizer import AbstractSummarizer
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+from ._summarizer import AbstractSummarizer, UNRANKED_RATING
 
 
 class KLSummarizer(AbstractSummarizer):
@@ -16,13 +21,26 @@ class KLSummarizer(AbstractSummarizer):
     """
 
     stop_words = frozenset()
+    vectorized = False
+    # relative difference of divergences considered as a tie of sentences
+    _TIE_TOLERANCE = 1e-9
 
     def __call__(self, document, sentences_count):
+        self._ensure_dependencies_installed()
         sentences = document.sentences
-        ratings = self._compute_ratings(sentences)
+        limit = self._get_items_count(sentences_count, len(sentences))
+        sentences_as_words = self._get_content_words(document)
+        if self.vectorized:
+            ratings = self._compute_ratings_vectorized(sentences, limit, sentences_as_words)
+        else:
+            ratings = self._compute_ratings(sentences, limit, sentences_as_words)
 
         return self._get_best_sentences(sentences, sentences_count, ratings)
 
+    def _ensure_dependencies_installed(self):
+        if self.vectorized and numpy is None:
+            raise ValueError("Vectorized KL-Sum summarizer requires NumPy. Please, install it by command 'pip install numpy'.")
+
     @staticmethod
     def _get_all_words_in_doc(sentences):
         return [w for s in sentences for w in s.words]
@@ -32,6 +50,14 @@ class KLSummarizer(AbstractSummarizer):
         normalized_content_words = self._filter_out_stop_words(normalized_words)
         return normalized_content_words
 
+    def _get_content_words(self, document):
+        """
+        Returns content words of every sentence of the document taken from
+        its encoded view shared by the summarizers. Words are not stemmed.
+        """
+        encoded_document = self._get_encoded_document(document)
+        return [encoded_document.get_words(ids, self.stop_words) for ids in encoded_document.sentences]
+
     def _normalize_words(self, words):
         return [self.normalize_word(w) for w in words]
 
@@ -108,40 +134,201 @@ class KLSummarizer(AbstractSummarizer):
         """
         return kls.index(min(kls))
 
-    def _compute_ratings(self, sentences):
+    @staticmethod
+    def _update_summary_parts(summary_parts, summary_word_freq, word_freq, doc_freq):
+        """
+        Updates parts of the KL divergence of the summary given by ``summary_word_freq``
+        extended by the words in ``word_freq``. Only the extending words are touched.
+
+        The divergence of the summary ``S`` with ``N`` words is
+        ``sum(D(w) * log(D(w) * N / S(w)))`` for every word ``w`` in summary with
+        non-zero frequency ``D(w)`` in document. Independent parts of the sum are
+        ``sum(D(w) * log(D(w)))``, ``sum(D(w))`` and ``sum(D(w) * log(S(w)))``.
+        """
+        entropy, mass, log_counts = summary_parts
+        for w, count in word_freq.items():
+            frequency = doc_freq.get(w)
+            if not frequency:  # missing or zero = no frequency
+                continue
+
+            summary_count = summary_word_freq.get(w, 0)
+            if summary_count:
+                log_counts -= frequency * math.log(summary_count)
+            else:
+                entropy += frequency * math.log(frequency)
+                mass += frequency
+            log_counts += frequency * math.log(summary_count + count)
+
+        return entropy, mass, log_counts
+
+    @staticmethod
+    def _kl_divergence_from_parts(summary_parts, summary_length):
+        entropy, mass, log_counts = summary_parts
+        if not mass:
+            return 0.0
+
+        return entropy + mass * math.log(summary_length) - log_counts
+
+    def _break_tie(self, kls, best_index, sentences_as_words, summary_as_word_list, word_freq):
+        """
+        Incremental divergences differ from the directly computed ones by rounding errors.
+        Sentences with (almost) the same divergence as the best one are compared by
+        the direct computation so the order of the selected sentences is not changed.
+        """
+        tolerance = self._TIE_TOLERANCE * max(1.0, abs(kls[best_index]))
+        tied_indexes = [i for i, kl in enumerate(kls) if kl - kls[best_index] <= tolerance]
+        if len(tied_indexes) == 1:
+            return best_index
+
+        exact_kls = [self._kl_divergence(self._joint_freq(sentences_as_words[i], summary_as_word_list), word_freq)
+            for i in tied_indexes]
+        return tied_indexes[self._find_index_of_best_sentence(exact_kls)]
+
+    def _compute_ratings(self, sentences, limit=None, sentences_as_words=None):
+        """
+        Rates sentences by the order they are added into the summary. When ``limit``
+        is given only that many sentences are ranked and the rest is rated
+        by :data:`UNRANKED_RATING`. Content words of the sentences may be given
+        precomputed by ``sentences_as_words``.
+        """
         word_freq = self.compute_tf(sentences)
         ratings = {}
-        summary = []
 
         # make it a list so that it can be modified
         sentences_list = list(sentences)
 
-        # get all content words once for efficiency
-        sentences_as_words = [self._get_content_words_in_sentence(s) for s in sentences]
+        # get all content words and their counts once for efficiency
+        if sentences_as_words is None:
+            sentences_as_words = [self._get_content_words_in_sentence(s) for s in sentences]
+        else:
+            # the list is modified below
+            sentences_as_words = list(sentences_as_words)
+        sentences_word_freq = [self._compute_word_freq(words) for words in sentences_as_words]
+
+        # running word counts of the summary and parts of its KL divergence
+        summary_as_word_list = []
+        summary_word_freq = {}
+        summary_length = 0
+        summary_parts = (0.0, 0.0, 0.0)
 
         # Removes one sentence per iteration by adding to summary
-        while len(sentences_list) > 0:
+        while len(sentences_list) > 0 and (limit is None or len(sentences) - len(sentences_list) < limit):
             # will store all the kls values for this pass
             kls = []
 
-            # converts summary to word list
-            summary_as_word_list = self._get_all_words_in_doc(summary)
-
-            for s in sentences_as_words:
-                # calculates the joint frequency through combining the word lists
-                joint_freq = self._joint_freq(s, summary_as_word_list)
-
-                # adds the calculated kl divergence to the list in index = sentence used
-                kls.append(self._kl_divergence(joint_freq, word_freq))
+            for words, words_freq in zip(sentences_as_words, sentences_word_freq):
+                # KL divergence of summary joined with the sentence is computed only from the words of sentence
+                parts = self._update_summary_parts(summary_parts, summary_word_freq, words_freq, word_freq)
+                kls.append(self._kl_divergence_from_parts(parts, len(words) + summary_length))
 
             # to consider and then add it into the summary
             index_to_remove = self._find_index_of_best_sentence(kls)
+            index_to_remove = self._break_tie(kls, index_to_remove, sentences_as_words, summary_as_word_list, word_freq)
             best_sentence = sentences_list.pop(index_to_remove)
             del sentences_as_words[index_to_remove]
-            summary.append(best_sentence)
+            del sentences_word_freq[index_to_remove]
+
+            # summary is counted from all the words of its sentences
+            best_sentence_word_freq = self._compute_word_freq(best_sentence.words)
+            summary_parts = self._update_summary_parts(summary_parts, summary_word_freq, best_sentence_word_freq,
+                word_freq)
+            for w, count in best_sentence_word_freq.items():
+                summary_word_freq[w] = summary_word_freq.get(w, 0) + count
+            summary_length += len(best_sentence.words)
+            summary_as_word_list.extend(best_sentence.words)
 
             # value is the iteration in which it was removed multiplied by -1 so that
             # the first sentences removed (the most important) have highest values
             ratings[best_sentence] = -1 * len(ratings)
 
+        for sentence in sentences_list:
+            ratings.setdefault(sentence, UNRANKED_RATING)
+
+        return ratings
+
+    def _compute_ratings_vectorized(self, sentences, limit=None, sentences_as_words=None):
+        """
+        The same as :meth:`_compute_ratings` but the parts of KL divergences
+        of all the candidate sentences are updated at once by NumPy.
+        """
+        if len(sentences) < 2:
+            # there is nothing to compare so both ways rate the only sentence the same
+            return self._compute_ratings(sentences, limit, sentences_as_words)
+
+        word_freq = self.compute_tf(sentences)
+        if sentences_as_words is None:
+            sentences_as_words = [self._get_content_words_in_sentence(s) for s in sentences]
+
+        vocabulary = {}
+        sentences_as_ids = [[vocabulary.setdefault(w, len(vocabulary)) for w in words] for words in sentences_as_words]
+        # summary is counted from all the words of its sentences
+        summary_ids = [numpy.array([vocabulary.setdefault(w, len(vocabulary)) for w in s.words], dtype=numpy.intp)
+            for s in sentences]
+        doc_freq = numpy.zeros(len(vocabulary))
+        for w, i in vocabulary.items():
+            doc_freq[i] = word_freq.get(w, 0.0)
+
+        # word counts of sentences in COO format, only words with non-zero frequency in document matter
+        lengths = numpy.array([len(ids) for ids in sentences_as_ids], dtype=numpy.intp)
+        keys = numpy.repeat(numpy.arange(len(sentences)), lengths) * len(vocabulary)
+        keys += numpy.fromiter((i for ids in sentences_as_ids for i in ids), dtype=numpy.intp, count=lengths.sum())
+        keys, counts = numpy.unique(keys, return_counts=True)
+        rows, columns = numpy.divmod(keys, max(len(vocabulary), 1))
+        frequencies = doc_freq[columns]
+        nonzero = frequencies > 0
+        rows, columns, counts, frequencies = rows[nonzero], columns[nonzero], counts[nonzero], frequencies[nonzero]
+        entropies = frequencies * numpy.log(frequencies)
+
+        # running word counts of the summary and parts of its KL divergence
+        summary_as_word_list = []
+        summary_word_counts = numpy.zeros(len(vocabulary))
+        summary_length = 0
+        entropy, mass, log_counts = 0.0, 0.0, 0.0
+
+        ratings = {}
+        picked = numpy.zeros(len(sentences), dtype=bool)
+        for _ in range(len(sentences) if limit is None else min(limit, len(sentences))):
+            summary_counts = summary_word_counts[columns]
+            missing = summary_counts == 0
+            candidate_entropy = entropy + numpy.bincount(rows, weights=entropies * missing, minlength=len(sentences))
+            candidate_mass = mass + numpy.bincount(rows, weights=frequencies * missing, minlength=len(sentences))
+            log_differences = numpy.log(summary_counts + counts) - numpy.log(numpy.where(missing, 1.0, summary_counts))
+            candidate_log_counts = log_counts + numpy.bincount(rows, weights=frequencies * log_differences,
+                minlength=len(sentences))
+
+            kls = candidate_entropy + candidate_mass * numpy.log(numpy.maximum(lengths + summary_length, 1)) - candidate_log_counts
+            kls[candidate_mass == 0] = 0.0
+            kls[picked] = numpy.inf
+
+            best_index = int(numpy.argmin(kls))
+            tolerance = self._TIE_TOLERANCE * max(1.0, abs(kls[best_index]))
+            if numpy.count_nonzero(kls - kls[best_index] <= tolerance) > 1:
+                best_index = self._break_tie(kls.tolist(), best_index, sentences_as_words, summary_as_word_list, word_freq)
+            picked[best_index] = True
+
+            best_sentence = sentences[best_index]
+            word_ids, word_counts = numpy.unique(summary_ids[best_index], return_counts=True)
+            best_frequencies = doc_freq[word_ids]
+            best_summary_counts = summary_word_counts[word_ids]
+            for frequency, summary_count, count in zip(best_frequencies, best_summary_counts, word_counts):
+                if not frequency:  # missing or zero = no frequency
+                    continue
+                if summary_count:
+                    log_counts -= frequency * math.log(summary_count)
+                else:
+                    entropy += frequency * math.log(frequency)
+                    mass += frequency
+                log_counts += frequency * math.log(summary_count + count)
+
+            summary_word_counts[word_ids] += word_counts
+            summary_length += len(best_sentence.words)
+            summary_as_word_list.extend(best_sentence.words)
+
+            # value is the iteration in which it was removed multiplied by -1 so that
+            # the first sentences removed (the most important) have highest values
+            ratings[best_sentence] = -1 * len(ratings)
+
+        for i in numpy.flatnonzero(~picked):
+            ratings.setdefault(sentences[i], UNRANKED_RATING)
+
         return ratings
@@ -9,8 +9,16 @@ try:
     import numpy
 except ImportError:
     numpy = None
-from collections import Counter
+
+try:
+    from scipy import sparse
+except ImportError:
+    sparse = None
+
+from collections import Counter, OrderedDict
+from ..nlp.stemmers import stem_many
 from ._summarizer import AbstractSummarizer
+from ._power_method import power_iteration
 
 
 class LexRankSummarizer(AbstractSummarizer):
@@ -20,7 +28,29 @@ class LexRankSummarizer(AbstractSummarizer):
     """
     threshold = 0.1
     epsilon = 0.1
+    max_iterations = 1000
+    # build the similarity matrix from one sparse TF*IDF matrix instead of per-pair cosines (requires SciPy)
+    vectorized = False
+    # continuous LexRank keeps cosine similarities as edge weights instead of thresholding them (requires SciPy)
+    continuous = False
+    # approximate LexRank computes similarities only for the pairs of sentences
+    # found by MinHash locality-sensitive hashing of their terms (requires SciPy);
+    # pairs with Jaccard similarity above about (1/lsh_bands)**(1/lsh_rows) are likely found,
+    # the defaults find only about 55 % of the edges of the exact graph (see `approximation_recall`)
+    approximate = False
+    lsh_bands = 32
+    lsh_rows = 2
+    lsh_seed = 0
+    # buckets with more sentences (sharing only a common term) produce no candidate pairs
+    lsh_max_bucket_size = 100
+    # number of candidate pairs whose similarities are computed at once
+    _LSH_PAIRS_CHUNK_SIZE = 100000
+    # instance of :class:`sumy.models.IdfTable` computed from a background corpus
+    # used instead of IDF computed from the sentences of the summarized document
+    idf_table = None
     _stop_words = frozenset()
+    # report of the power method from the last call of the summarizer
+    convergence_report = None
 
     @property
     def stop_words(self):
@@ -33,27 +63,75 @@ class LexRankSummarizer(AbstractSummarizer):
     def __call__(self, document, sentences_count):
         self._ensure_dependencies_installed()
 
-        sentences_words = [self._to_words_set(s) for s in document.sentences]
+        sentences_words = self._stem_content_words(document, self._stop_words)
         if not sentences_words:
             return tuple()
 
+        inverted_index = self._create_inverted_index(sentences_words)
         tf_metrics = self._compute_tf(sentences_words)
-        idf_metrics = self._compute_idf(sentences_words)
+        idf_metrics = self._compute_idf(sentences_words, inverted_index, self.idf_table)
 
-        matrix = self._create_matrix(sentences_words, self.threshold, tf_metrics, idf_metrics)
-        scores = self.power_method(matrix, self.epsilon)
+        if self._requires_sparse_matrix():
+            lsh_parameters = self._get_lsh_parameters() if self.approximate else None
+            matrix = self._create_sparse_matrix(sentences_words, self.threshold, tf_metrics, idf_metrics,
+                inverted_index, self.continuous, lsh_parameters)
+        else:
+            matrix = self._create_matrix(sentences_words, self.threshold, tf_metrics, idf_metrics)
+        scores, self.convergence_report = power_iteration(matrix, self.epsilon, self.max_iterations, normalize=True)
         ratings = dict(zip(document.sentences, scores))
 
         return self._get_best_sentences(document.sentences, sentences_count, ratings)
 
-    @staticmethod
-    def _ensure_dependencies_installed():
+    def approximation_recall(self, documents):
+        """
+        Computes recall of the approximate (LSH) graph against the exact one
+        over the given corpus. Use it to tune ``lsh_bands`` and ``lsh_rows``.
+
+        :param documents:
+            Iterable of documents (the benchmark corpus).
+        :rtype: float
+        :return:
+            Ratio of edges of the exact graphs found also in the approximate graphs.
+        """
+        self._ensure_dependencies_installed(sparse_matrix=True)
+
+        # continuous graph contains all the non-zero similarities
+        threshold = 0.0 if self.continuous else self.threshold
+        exact_edges_count = found_edges_count = 0
+        for document in documents:
+            sentences_words = self._stem_content_words(document, self._stop_words)
+            if not sentences_words:
+                continue
+
+            inverted_index = self._create_inverted_index(sentences_words)
+            tf_metrics = self._compute_tf(sentences_words)
+            idf_metrics = self._compute_idf(sentences_words, inverted_index, self.idf_table)
+            tf_idf = self._create_tf_idf_matrix(sentences_words, tf_metrics, idf_metrics, inverted_index)
+
+            # similarities of the sentences with themselves are not the edges
+            exact_edges = sparse.triu(tf_idf.dot(tf_idf.T) > threshold, k=1)
+            approximate_similarities = self._compute_approximate_similarities(tf_idf, *self._get_lsh_parameters())
+            found_edges = sparse.triu(approximate_similarities > threshold, k=1)
+            exact_edges_count += exact_edges.nnz
+            found_edges_count += exact_edges.multiply(found_edges).nnz
+
+        return found_edges_count / exact_edges_count if exact_edges_count else 1.0
+
+    def _requires_sparse_matrix(self):
+        return self.vectorized or self.continuous or self.approximate
+
+    def _get_lsh_parameters(self):
+        return self.lsh_bands, self.lsh_rows, self.lsh_seed, self.lsh_max_bucket_size
+
+    def _ensure_dependencies_installed(self, sparse_matrix=False):
         if numpy is None:
             raise ValueError("LexRank summarizer requires NumPy. Please, install it by command 'pip install numpy'.")
+        if (sparse_matrix or self._requires_sparse_matrix()) and sparse is None:
+            raise ValueError("Vectorized LexRank summarizer requires SciPy. Please, install it by command 'pip install scipy'.")
 
     def _to_words_set(self, sentence):
         words = map(self.normalize_word, sentence.words)
-        return [self.stem_word(w) for w in words if w not in self._stop_words]
+        return stem_many(self._stemmer, [w for w in words if w not in self._stop_words])
 
     def _compute_tf(self, sentences):
         tf_values = map(Counter, sentences)
@@ -75,17 +153,37 @@ class LexRankSummarizer(AbstractSummarizer):
         return max(terms.values()) if terms else 1
 
     @staticmethod
-    def _compute_idf(sentences):
-        idf_metrics = {}
-        sentences_count = len(sentences)
-
-        for sentence in sentences:
+    def _create_inverted_index(sentences):
+        """
+        Creates mapping key = term, value = list of indexes of sentences
+        containing the term (every sentence is listed only once). Terms are
+        ordered by their first occurrence so the columns of TF*IDF matrix
+        (hashed by LSH) don't depend on the hashing of strings.
+        """
+        inverted_index = OrderedDict()
+        for index, sentence in enumerate(sentences):
             for term in sentence:
-                if term not in idf_metrics:
-                    n_j = sum(1 for s in sentences if term in s)
-                    idf_metrics[term] = math.log(sentences_count / (1 + n_j))
+                postings = inverted_index.setdefault(term, [])
+                if not postings or postings[-1] != index:
+                    postings.append(index)
+
+        return inverted_index
+
+    @staticmethod
+    def _compute_idf(sentences, inverted_index=None, idf_table=None):
+        """
+        Computes IDF of the terms from the sentences or takes it
+        from the ``idf_table`` of a background corpus if given.
+        """
+        if inverted_index is None:
+            inverted_index = LexRankSummarizer._create_inverted_index(sentences)
+
+        if idf_table is not None:
+            return idf_table.idf_metrics(inverted_index)
 
-        return idf_metrics
+        sentences_count = len(sentences)
+        return dict((term, math.log(sentences_count / (1 + len(postings))))
+            for term, postings in inverted_index.items())
 
     def _create_matrix(self, sentences, threshold, tf_metrics, idf_metrics):
         """
@@ -115,6 +213,138 @@ class LexRankSummarizer(AbstractSummarizer):
 
         return matrix
 
+    @staticmethod
+    def _create_sparse_matrix(sentences, threshold, tf_metrics, idf_metrics, inverted_index=None,
+            continuous=False, lsh_parameters=None):
+        """
+        Creates the same matrix as :meth:`_create_matrix` but as a sparse
+        matrix computed by a single product of L2-normalized TF*IDF vectors.
+        Continuous matrix keeps the similarities as weights of the edges
+        and the ``threshold`` is ignored. It's not created at all but its
+        products are computed from the TF*IDF matrix so the memory doesn't grow
+        with the number of similar pairs. Approximate matrix contains only
+        the similarities of candidate pairs found by LSH with ``lsh_parameters``
+        (bands, rows, seed, max bucket size) if they are given.
+        """
+        if inverted_index is None:
+            inverted_index = LexRankSummarizer._create_inverted_index(sentences)
+
+        tf_idf = LexRankSummarizer._create_tf_idf_matrix(sentences, tf_metrics, idf_metrics, inverted_index)
+        if continuous and lsh_parameters is None:
+            return _CosineSimilarityMatrix(tf_idf)
+
+        if lsh_parameters is not None:
+            similarities = LexRankSummarizer._compute_approximate_similarities(tf_idf, *lsh_parameters)
+        else:
+            similarities = tf_idf.dot(tf_idf.T).tocsr()
+
+        if continuous:
+            matrix = similarities
+            matrix.eliminate_zeros()
+        else:
+            matrix = (similarities > threshold).astype(numpy.float64)
+
+        degrees = numpy.asarray(matrix.sum(axis=1)).ravel()
+        degrees[degrees == 0] = 1.0
+
+        return sparse.diags(1.0 / degrees).dot(matrix).tocsr()
+
+    @staticmethod
+    def _create_tf_idf_matrix(sentences, tf_metrics, idf_metrics, inverted_index):
+        """
+        Creates sparse matrix of shape |sentences|×|terms| with L2-normalized
+        TF*IDF vectors of the sentences in rows.
+        """
+        # every term of inverted index is one column of TF*IDF matrix
+        rows, cols, values = [], [], []
+        for col, (term, postings) in enumerate(inverted_index.items()):
+            idf = idf_metrics[term]
+            for row in postings:
+                rows.append(row)
+                cols.append(col)
+                values.append(tf_metrics[row][term] * idf)
+
+        shape = (len(sentences), len(inverted_index))
+        tf_idf = sparse.csr_matrix((values, (rows, cols)), shape=shape)
+        # terms with zero weight don't contribute to the similarities
+        tf_idf.eliminate_zeros()
+
+        # sentences without weighted terms have zero similarity with every sentence
+        norms = numpy.sqrt(numpy.asarray(tf_idf.multiply(tf_idf).sum(axis=1)).ravel())
+        norms[norms == 0] = 1.0
+
+        return sparse.diags(1.0 / norms).dot(tf_idf).tocsr()
+
+    @staticmethod
+    def _compute_approximate_similarities(tf_idf, bands, rows_per_band, seed, max_bucket_size):
+        """
+        Computes sparse matrix of similarities only for the candidate pairs
+        of sentences and for every sentence with itself.
+        """
+        sentences_count = tf_idf.shape[0]
+        candidates = LexRankSummarizer._find_candidate_pairs(tf_idf, bands, rows_per_band, seed, max_bucket_size)
+        rows, cols = candidates // sentences_count, candidates % sentences_count
+
+        values = numpy.empty(len(candidates))
+        chunk_size = LexRankSummarizer._LSH_PAIRS_CHUNK_SIZE
+        for start in range(0, len(candidates), chunk_size):
+            chunk = slice(start, start + chunk_size)
+            products = tf_idf[rows[chunk]].multiply(tf_idf[cols[chunk]])
+            values[chunk] = numpy.asarray(products.sum(axis=1)).ravel()
+
+        diagonal = numpy.asarray(tf_idf.multiply(tf_idf).sum(axis=1)).ravel()
+        indexes = numpy.arange(sentences_count)
+
+        rows, cols = numpy.concatenate((rows, cols, indexes)), numpy.concatenate((cols, rows, indexes))
+        values = numpy.concatenate((values, values, diagonal))
+        return sparse.csr_matrix((values, (rows, cols)), shape=(sentences_count, sentences_count))
+
+    @staticmethod
+    def _find_candidate_pairs(tf_idf, bands, rows_per_band, seed, max_bucket_size):
+        """
+        Finds pairs of sentences sharing a bucket in at least one of ``bands``
+        of their MinHash signatures. Every pair (i, j), i < j, is encoded
+        as a single number ``i*|sentences| + j``. Buckets with more than
+        ``max_bucket_size`` sentences are skipped so the number of pairs
+        doesn't grow with the square of the number of sentences.
+        """
+        sentences_count = tf_idf.shape[0]
+        terms = tf_idf.indices.astype(numpy.int64)
+        starts = tf_idf.indptr[:-1]
+        non_empty = numpy.flatnonzero(numpy.diff(tf_idf.indptr))
+        if len(non_empty) < 2:
+            return numpy.empty(0, dtype=numpy.int64)
+
+        # universal hashing (a*x + b) mod p simulates random permutations of terms
+        prime = 2**31 - 1
+        random_state = numpy.random.RandomState(seed)
+
+        candidates = numpy.empty(0, dtype=numpy.int64)
+        for _ in range(bands):
+            a = random_state.randint(1, prime, size=(rows_per_band, 1)).astype(numpy.int64)
+            b = random_state.randint(0, prime, size=(rows_per_band, 1)).astype(numpy.int64)
+            hashes = (a * terms + b) % prime
+            signatures = numpy.minimum.reduceat(hashes, starts[non_empty], axis=1)
+
+            _, buckets = numpy.unique(signatures.T, axis=0, return_inverse=True)
+            buckets = buckets.ravel()
+
+            # only buckets with more than one sentence (but not too many) produce pairs
+            bucket_sizes = numpy.bincount(buckets)[buckets]
+            shared = numpy.flatnonzero((bucket_sizes > 1) & (bucket_sizes <= max_bucket_size))
+            shared = shared[numpy.argsort(buckets[shared], kind="mergesort")]
+            boundaries = numpy.flatnonzero(numpy.diff(buckets[shared])) + 1
+
+            pairs = [candidates]
+            for bucket in numpy.split(shared, boundaries):
+                members = non_empty[bucket]
+                first, second = numpy.triu_indices(len(members), 1)
+                pairs.append(members[first] * sentences_count + members[second])
+            # duplicates are removed after every band to keep the memory bounded by unique pairs
+            candidates = numpy.unique(numpy.concatenate(pairs))
+
+        return candidates
+
     @staticmethod
     def cosine_similarity(sentence1, sentence2, tf1, tf2, idf_metrics):
         """
@@ -156,16 +386,50 @@ class LexRankSummarizer(AbstractSummarizer):
             return 0.0
 
     @staticmethod
-    def power_method(matrix, epsilon):
-        transposed_matrix = matrix.T
-        sentences_count = len(matrix)
-        p_vector = numpy.array([1.0 / sentences_count] * sentences_count)
-        lambda_val = 1.0
-
-        while lambda_val > epsilon:
-            next_p = numpy.dot(transposed_matrix, p_vector)
-            next_p /= numpy.linalg.norm(next_p)
-            lambda_val = numpy.linalg.norm(numpy.subtract(next_p, p_vector))
-            p_vector = next_p
-
+    def power_method(matrix, epsilon, max_iterations=max_iterations, initial_vector=None):
+        p_vector, _ = power_iteration(matrix, epsilon, max_iterations, initial_vector, normalize=True)
         return p_vector
+
+
+class _CosineSimilarityMatrix(object):
+    """
+    Matrix ``D^-1 * T * T^T`` of cosine similarities of L2-normalized TF*IDF
+    vectors in rows of sparse matrix ``T`` normalized by the degrees ``D`` of
+    the sentences. Only products needed by the power method are supported so
+    the matrix of similarities is never created unless :meth:`toarray` is called.
+    """
+    def __init__(self, tf_idf, inverse_degrees=None, transposed=False):
+        self._tf_idf = tf_idf
+        self._transposed_tf_idf = tf_idf.T.tocsr()
+        if inverse_degrees is None:
+            degrees = tf_idf.dot(self._transposed_tf_idf.dot(numpy.ones(tf_idf.shape[0])))
+            degrees[degrees == 0] = 1.0
+            inverse_degrees = 1.0 / degrees
+
+        self._inverse_degrees = inverse_degrees
+        self._transposed = transposed
+        self.shape = (tf_idf.shape[0], tf_idf.shape[0])
+        self.dtype = numpy.dtype(numpy.float64)
+
+    @property
+    def T(self):
+        return _CosineSimilarityMatrix(self._tf_idf, self._inverse_degrees, not self._transposed)
+
+    @property
+    def nnz(self):
+        """Number of the stored items (of the TF*IDF matrix and its transposition)."""
+        return self._tf_idf.nnz + self._transposed_tf_idf.nnz
+
+    def dot(self, other):
+        # similarities are symmetric so only the side of the degrees differs
+        if self._transposed:
+            other = (self._inverse_degrees * other.T).T
+        product = self._tf_idf.dot(self._transposed_tf_idf.dot(other))
+        if not self._transposed:
+            product = (self._inverse_degrees * product.T).T
+
+        return product
+
+    def toarray(self):
+        matrix = self._tf_idf.dot(self._transposed_tf_idf).toarray() * self._inverse_degrees[:, numpy.newaxis]
+        return matrix.T if self._transposed else matrix
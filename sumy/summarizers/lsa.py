@@ -3,8 +3,6 @@
 from __future__ import absolute_import
 from __future__ import division, print_function, unicode_literals
 
-import math
-
 from warnings import warn
 
 try:
@@ -16,12 +14,28 @@ try:
     from numpy.linalg import svd as singular_value_decomposition
 except ImportError:
     singular_value_decomposition = None
+
+try:
+    from scipy import sparse
+    from scipy.sparse.linalg import svds as truncated_singular_value_decomposition
+except ImportError:
+    sparse = None
+    truncated_singular_value_decomposition = None
+
 from ._summarizer import AbstractSummarizer
 
 
 class LsaSummarizer(AbstractSummarizer):
     MIN_DIMENSIONS = 3
     REDUCTION_RATIO = 1/1
+    SVD_BACKENDS = ("full", "randomized", "lanczos",)
+    # "full" computes all singular triplets, "randomized" (range finder) and "lanczos"
+    # (requires SciPy) compute only the top `svd_dimensions` of them
+    svd_backend = "full"
+    svd_dimensions = 100
+    svd_oversampling = 10
+    svd_power_iterations = 2
+    svd_seed = 0
     _stop_words = frozenset()
 
     @property
@@ -35,14 +49,14 @@ class LsaSummarizer(AbstractSummarizer):
     def __call__(self, document, sentences_count):
         self._ensure_dependecies_installed()
 
-        dictionary = self._create_dictionary(document)
+        dictionary, sentences_terms = self._encode_document(document)
         # empty document
         if not dictionary:
             return ()
 
-        matrix = self._create_matrix(document, dictionary)
+        matrix = self._create_matrix(sentences_terms, dictionary)
         matrix = self._compute_term_frequency(matrix)
-        u, sigma, v = singular_value_decomposition(matrix, full_matrices=False)
+        u, sigma, v = self._compute_svd(matrix)
 
         ranks = iter(self._compute_ranks(sigma, v))
         return self._get_best_sentences(document.sentences, sentences_count,
@@ -51,23 +65,53 @@ class LsaSummarizer(AbstractSummarizer):
     def _ensure_dependecies_installed(self):
         if numpy is None:
             raise ValueError("LSA summarizer requires NumPy. Please, install it by command 'pip install numpy'.")
+        if self.svd_backend not in self.SVD_BACKENDS:
+            raise ValueError("Unknown SVD backend '%s'. Choose one of: %s." % (self.svd_backend, ", ".join(self.SVD_BACKENDS)))
+        if self.svd_backend == "lanczos" and truncated_singular_value_decomposition is None:
+            raise ValueError("LSA summarizer with Lanczos SVD requires SciPy. Please, install it by command 'pip install scipy'.")
 
     def _create_dictionary(self, document):
         """Creates mapping key = word, value = row index"""
-        words = map(self.normalize_word, document.words)
-        unique_words = frozenset(self.stem_word(w) for w in words if w not in self._stop_words)
-
-        return dict((w, i) for i, w in enumerate(unique_words))
+        dictionary, _ = self._encode_document(document)
+        return dictionary
 
-    def _create_matrix(self, document, dictionary):
+    def _encode_document(self, document):
+        """
+        Creates the dictionary (mapping key = word, value = row index) and the list
+        of row indexes of words for every sentence in one pass over the encoded view
+        of the document. Stop-words are not added into the dictionary but their stems
+        are counted in the sentences if other words share them.
+        """
+        encoded_document = self._get_encoded_document(document)
+        stems, stem_ids = encoded_document.stems, encoded_document.stem_ids
+        stop_words_mask = encoded_document.get_stop_words_mask(self._stop_words)
+        dictionary = {}
+
+        def encode(word_ids):
+            sentence_stems = []
+            for word_id in word_ids:
+                stem = stems[stem_ids[word_id]]
+                sentence_stems.append(stem)
+                if stem not in dictionary and not stop_words_mask[word_id]:
+                    dictionary[stem] = len(dictionary)
+
+            return sentence_stems
+
+        # headings contribute only to the dictionary
+        for heading in encoded_document.headings:
+            encode(heading)
+        sentences_stems = [encode(ids) for ids in encoded_document.sentences]
+
+        sentences_terms = [[dictionary[s] for s in stems if s in dictionary] for stems in sentences_stems]
+        return dictionary, sentences_terms
+
+    def _create_matrix(self, sentences_terms, dictionary):
         """
         Creates matrix of shape |unique words|×|sentences| where cells
         contains number of occurrences of words (rows) in sentences (cols).
         """
-        sentences = document.sentences
-
         words_count = len(dictionary)
-        sentences_count = len(sentences)
+        sentences_count = len(sentences_terms)
         if words_count < sentences_count:
             message = (
                 "Number of words (%d) is lower than number of sentences (%d). "
@@ -75,15 +119,18 @@ class LsaSummarizer(AbstractSummarizer):
             )
             warn(message % (words_count, sentences_count))
 
-        # create matrix |unique words|×|sentences| filled with zeroes
-        matrix = numpy.zeros((words_count, sentences_count))
-        for col, sentence in enumerate(sentences):
-            for word in map(self.stem_word, sentence.words):
-                # only valid words is counted (not stop-words, ...)
-                if word in dictionary:
-                    row = dictionary[word]
-                    matrix[row, col] += 1
+        rows, cols = [], []
+        for col, terms in enumerate(sentences_terms):
+            rows.extend(terms)
+            cols.extend([col] * len(terms))
 
+        # sparse matrix sums the duplicate cells, dense one is the fallback without SciPy
+        shape = (words_count, sentences_count)
+        if sparse is not None:
+            return sparse.csr_matrix((numpy.ones(len(rows)), (rows, cols)), shape=shape)
+
+        matrix = numpy.zeros(shape)
+        numpy.add.at(matrix, (rows, cols), 1)
         return matrix
 
     def _compute_term_frequency(self, matrix, smooth=0.4):
@@ -94,29 +141,105 @@ class LsaSummarizer(AbstractSummarizer):
         """
         assert 0.0 <= smooth < 1.0
 
-        max_word_frequencies = numpy.max(matrix, axis=0)
-        rows, cols = matrix.shape
-        for row in range(rows):
-            for col in range(cols):
-                max_word_frequency = max_word_frequencies[col]
-                if max_word_frequency != 0:
-                    frequency = matrix[row, col]/max_word_frequency
-                    matrix[row, col] = smooth + (1.0 - smooth)*frequency
+        if isinstance(matrix, numpy.ndarray):
+            max_word_frequencies = numpy.max(matrix, axis=0)
+            cols = max_word_frequencies != 0
+            frequencies = matrix[:, cols] / max_word_frequencies[cols]
+            matrix[:, cols] = smooth + (1.0 - smooth)*frequencies
+            return matrix
+
+        # smoothing fills also the empty cells so the result is kept as
+        # sparse matrix of scaled frequencies plus the smoothing of columns
+        max_word_frequencies = matrix.max(axis=0).toarray().ravel()
+        cols = max_word_frequencies != 0
+        scales = numpy.zeros(len(max_word_frequencies))
+        scales[cols] = (1.0 - smooth) / max_word_frequencies[cols]
+        smoothing = numpy.where(cols, smooth, 0.0)
+
+        frequencies = matrix.dot(sparse.diags(scales)).tocsr()
+        return _RankOneUpdatedMatrix(frequencies, numpy.ones(matrix.shape[0]), smoothing)
+
+    def _compute_svd(self, matrix):
+        """
+        Computes singular value decomposition of the matrix by the chosen backend.
+        Singular values are returned in descending order.
+        """
+        dimensions = self.svd_dimensions
+        if self.svd_backend == "full" or dimensions + self.svd_oversampling >= min(matrix.shape):
+            if not isinstance(matrix, numpy.ndarray):
+                matrix = matrix.toarray()
+            return singular_value_decomposition(matrix, full_matrices=False)
+        elif self.svd_backend == "randomized":
+            return self._randomized_svd(matrix, dimensions, self.svd_oversampling,
+                self.svd_power_iterations, self.svd_seed)
+        else:
+            u, sigma, v = truncated_singular_value_decomposition(matrix, k=dimensions)
+            order = numpy.argsort(sigma)[::-1]
+            return u[:, order], sigma[order], v[order]
+
+    @staticmethod
+    def _randomized_svd(matrix, dimensions, oversampling, power_iterations, seed):
+        """
+        Computes top singular triplets by randomized range finder.
+        Source: Halko, Martinsson, Tropp - Finding structure with randomness (2011)
+        https://arxiv.org/abs/0909.4061
+        """
+        random_state = numpy.random.RandomState(seed)
+        test_matrix = random_state.normal(size=(matrix.shape[1], dimensions + oversampling))
+
+        # orthonormal basis of the range of the matrix
+        basis, _ = numpy.linalg.qr(matrix.dot(test_matrix))
+        for _ in range(power_iterations):
+            basis, _ = numpy.linalg.qr(matrix.T.dot(basis))
+            basis, _ = numpy.linalg.qr(matrix.dot(basis))
 
-        return matrix
+        # SVD of the small matrix projected into the basis
+        projected_matrix = matrix.T.dot(basis).T
+        u, sigma, v = singular_value_decomposition(projected_matrix, full_matrices=False)
+
+        return basis.dot(u)[:, :dimensions], sigma[:dimensions], v[:dimensions]
 
     def _compute_ranks(self, sigma, v_matrix):
         assert len(sigma) == v_matrix.shape[0], "Matrices should be multiplicable"
 
         dimensions = max(LsaSummarizer.MIN_DIMENSIONS,
             int(len(sigma)*LsaSummarizer.REDUCTION_RATIO))
-        powered_sigma = tuple(s**2 if i < dimensions else 0.0
-            for i, s in enumerate(sigma))
+        powered_sigma = numpy.array([s**2 if i < dimensions else 0.0
+            for i, s in enumerate(sigma)])
+
+        # rank of every sentence (column of matrix) at once
+        ranks = numpy.sqrt(powered_sigma.dot(numpy.square(v_matrix)))
+        return ranks.tolist()
+
+
+class _RankOneUpdatedMatrix(object):
+    """
+    Matrix ``S + u*v^T`` where ``S`` is sparse matrix and ``u``, ``v`` are vectors.
+    Only products needed by truncated SVD are supported so the dense matrix
+    is never created unless :meth:`toarray` is called.
+    """
+    def __init__(self, sparse_matrix, left_vector, right_vector):
+        self._sparse_matrix = sparse_matrix
+        self._left_vector = left_vector
+        self._right_vector = right_vector
+        self.shape = sparse_matrix.shape
+        self.dtype = numpy.dtype(numpy.float64)
+
+    @property
+    def T(self):
+        return _RankOneUpdatedMatrix(self._sparse_matrix.T.tocsr(), self._right_vector, self._left_vector)
+
+    def dot(self, other):
+        product = self._sparse_matrix.dot(other)
+        return product + numpy.multiply.outer(self._left_vector, self._right_vector.dot(other))
+
+    def toarray(self):
+        return self._sparse_matrix.toarray() + numpy.outer(self._left_vector, self._right_vector)
+
+    # interface of ``scipy.sparse.linalg.LinearOperator``
+    matvec = matmat = dot
 
-        ranks = []
-        # iterate over columns of matrix (rows of transposed matrix)
-        for column_vector in v_matrix.T:
-            rank = sum(s*v**2 for s, v in zip(powered_sigma, column_vector))
-            ranks.append(math.sqrt(rank))
+    def rmatvec(self, other):
+        return self.T.dot(other)
 
-        return ranks
+    rmatmat = rmatvec
@@ -3,6 +3,7 @@
 from __future__ import absolute_import
 from __future__ import division, print_function, unicode_literals
 
+from itertools import chain
 from ..models import TfDocumentModel
 from ._summarizer import AbstractSummarizer
 
@@ -22,13 +23,42 @@ class LuhnSummarizer(AbstractSummarizer):
         self._stop_words = frozenset(map(self.normalize_word, words))
 
     def __call__(self, document, sentences_count):
-        words = self._get_significant_words(document.words)
+        stems = self._get_document_stems(document)
+        words = self._get_significant_words(document.words, stems)
         return self._get_best_sentences(document.sentences,
-            sentences_count, self.rate_sentence, words)
-
-    def _get_significant_words(self, words):
-        words = map(self.normalize_word, words)
-        words = tuple(self.stem_word(w) for w in words if w not in self._stop_words)
+            sentences_count, self.rate_sentence, words, stems)
+
+    def _get_document_stems(self, document):
+        """
+        Returns mapping word -> stem for all the words of the document
+        taken from its encoded view shared by the summarizers.
+        """
+        encoded_document = self._get_encoded_document(document)
+        sentences = chain(getattr(document, "headings", ()), document.sentences)
+        word_ids = chain(encoded_document.headings, encoded_document.sentences)
+
+        stems = {}
+        for sentence, ids in zip(sentences, word_ids):
+            stems.update(zip(sentence.words, encoded_document.get_stems(ids)))
+
+        return stems
+
+    def _get_stems(self, words):
+        """
+        Returns mapping word -> stem for all the words of the document so every
+        distinct word is stemmed only once and the stems are shared by both phases.
+        """
+        stems = {}
+        for w in words:
+            if w not in stems:
+                stems[w] = self.stem_word(w)
+
+        return stems
+
+    def _get_significant_words(self, words, stems=None):
+        if stems is None:
+            stems = self._get_stems(words)
+        words = tuple(stems[w] for w in words if self.normalize_word(w) not in self._stop_words)
 
         model = TfDocumentModel(words)
 
@@ -37,49 +67,51 @@ class LuhnSummarizer(AbstractSummarizer):
         words = model.most_frequent_terms(best_words_count)
 
         # take only words contained multiple times in document
-        return tuple(t for t in words if model.term_frequency(t) > 1)
+        return frozenset(t for t in words if model.term_frequency(t) > 1)
 
-    def rate_sentence(self, sentence, significant_stems):
-        ratings = self._get_chunk_ratings(sentence, significant_stems)
+    def rate_sentence(self, sentence, significant_stems, stems=None):
+        significance = self._get_significance(sentence, frozenset(significant_stems), stems)
+        ratings = self._get_chunk_ratings(significance)
         return max(ratings) if ratings else 0
 
-    def _get_chunk_ratings(self, sentence, significant_stems):
-        chunks = []
-        NONSIGNIFICANT_CHUNK = [0]*self.max_gap_size
-
-        in_chunk = False
-        for order, word in enumerate(sentence.words):
-            stem = self.stem_word(word)
-            # new chunk
-            if stem in significant_stems and not in_chunk:
-                in_chunk = True
-                chunks.append([1])
-            # append word to chunk
-            elif in_chunk:
-                is_significant_word = int(stem in significant_stems)
-                chunks[-1].append(is_significant_word)
-
+    def _get_significance(self, sentence, significant_stems, stems=None):
+        """Returns 0/1 flags of significant words of the sentence."""
+        if stems is None:
+            stems = self._get_stems(sentence.words)
+        return [int(stems[w] in significant_stems) for w in sentence.words]
+
+    def _get_chunk_ratings(self, significance):
+        """
+        Finds chunks of the sentence by single scan of its significance flags. Chunk starts
+        with a significant word and ends after ``max_gap_size`` non-significant words.
+        Trailing non-significant words are not part of the chunk.
+        """
+        ratings = []
+        chunk_start = last_significant = None
+        significant_words = 0
+
+        for order, is_significant in enumerate(significance):
+            if is_significant:
+                if chunk_start is None:
+                    chunk_start = order
+                    significant_words = 0
+                last_significant = order
+                significant_words += 1
             # end of chunk
-            if chunks and chunks[-1][-self.max_gap_size:] == NONSIGNIFICANT_CHUNK:
-                in_chunk = False
+            elif chunk_start is not None and 0 < self.max_gap_size <= order - last_significant:
+                ratings.append(self._get_chunk_rating(significant_words, last_significant - chunk_start + 1))
+                chunk_start = None
+
+        if chunk_start is not None:
+            ratings.append(self._get_chunk_rating(significant_words, last_significant - chunk_start + 1))
 
-        return tuple(map(self._get_chunk_rating, chunks))
+        return tuple(ratings)
 
-    def _get_chunk_rating(self, chunk):
-        chunk = self.__remove_trailing_zeros(chunk)
-        words_count = len(chunk)
+    @staticmethod
+    def _get_chunk_rating(significant_words, words_count):
         assert words_count > 0
 
-        significant_words = sum(chunk)
         if significant_words == 1:
             return 0
         else:
             return significant_words**2 / words_count
-
-    def __remove_trailing_zeros(self, collection):
-        """Removes trailing zeroes from indexable collection of numbers"""
-        index = len(collection) - 1
-        while index >= 0 and collection[index] == 0:
-            index -= 1
-
-        return collection[:index + 1]
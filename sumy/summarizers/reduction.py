@@ -5,8 +5,20 @@ from __future__ import division, print_function, unicode_literals
 
 import math
 
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+try:
+    from scipy import sparse
+except ImportError:
+    sparse = None
+
 from itertools import combinations
 from collections import defaultdict
+from multiprocessing.pool import ThreadPool
+from ..nlp.stemmers import stem_many
 from ._summarizer import AbstractSummarizer
 
 
@@ -14,6 +26,12 @@ class ReductionSummarizer(AbstractSummarizer):
     """Source: https://github.com/adamfabish/Reduction"""
 
     _stop_words = frozenset()
+    # compute overlaps of all the pairs by product of sparse term-count matrix (requires SciPy)
+    vectorized = False
+    # number of sentences rated by one matrix product, `None` means all of them at once
+    block_size = 1000
+    # number of threads rating the blocks of sentences in parallel
+    workers = 1
 
     @property
     def stop_words(self):
@@ -27,8 +45,18 @@ class ReductionSummarizer(AbstractSummarizer):
         ratings = self.rate_sentences(document)
         return self._get_best_sentences(document.sentences, sentences_count, ratings)
 
+    def _ensure_dependencies_installed(self):
+        if self.vectorized and numpy is None:
+            raise ValueError("Vectorized Reduction summarizer requires NumPy. Please, install it by command 'pip install numpy'.")
+        if self.vectorized and sparse is None:
+            raise ValueError("Vectorized Reduction summarizer requires SciPy. Please, install it by command 'pip install scipy'.")
+
     def rate_sentences(self, document):
-        sentences_words = [(s, self._to_words_set(s)) for s in document.sentences]
+        self._ensure_dependencies_installed()
+        if self.vectorized:
+            return self._rate_sentences_vectorized(document)
+
+        sentences_words = zip(document.sentences, self._stem_content_words(document, self._stop_words))
         ratings = defaultdict(float)
 
         for (sentence1, words1), (sentence2, words2) in combinations(sentences_words, 2):
@@ -38,9 +66,78 @@ class ReductionSummarizer(AbstractSummarizer):
 
         return ratings
 
+    def _rate_sentences_vectorized(self, document):
+        """
+        Computes the same ratings as :meth:`rate_sentences` from the sparse matrix
+        |sentences|×|terms| of term counts. Blocks of ``block_size`` sentences
+        are rated by ``workers`` threads so only ``block_size`` rows of the matrix
+        of overlaps are kept in memory at once.
+        """
+        sentences = document.sentences
+        sentences_as_words = self._stem_content_words(document, self._stop_words)
+        ratings = defaultdict(float)
+        if len(sentences) < 2:
+            # single sentence has no pair to be rated with
+            return ratings
+
+        counts = self._create_term_counts(sentences_as_words)
+        # logarithms by the module `math` to get exactly the same results as the pairwise rating
+        log_lengths = numpy.array([math.log(len(words)) if words else 0.0 for words in sentences_as_words])
+
+        block_size = self.block_size or len(sentences)
+        blocks = [(start, min(start + block_size, len(sentences))) for start in range(0, len(sentences), block_size)]
+
+        def rate_block(block):
+            return self._rate_block(counts, log_lengths, *block)
+
+        if self.workers > 1 and len(blocks) > 1:
+            pool = ThreadPool(self.workers)
+            try:
+                block_ratings = pool.map(rate_block, blocks)
+            finally:
+                pool.close()
+                pool.join()
+        else:
+            block_ratings = [rate_block(block) for block in blocks]
+
+        for sentence, rating in zip(sentences, numpy.concatenate(block_ratings).tolist()):
+            ratings[sentence] += rating
+
+        return ratings
+
+    @staticmethod
+    def _create_term_counts(sentences_as_words):
+        terms = {}
+        rows, cols = [], []
+        for row, words in enumerate(sentences_as_words):
+            for word in words:
+                rows.append(row)
+                cols.append(terms.setdefault(word, len(terms)))
+
+        shape = (len(sentences_as_words), len(terms))
+        return sparse.csr_matrix((numpy.ones(len(rows)), (rows, cols)), shape=shape)
+
+    @staticmethod
+    def _rate_block(counts, log_lengths, start, end):
+        """
+        Returns ratings of sentences from ``start`` to ``end`` as sums of the weights
+        of their edges to all the other sentences.
+        """
+        ranks = counts[start:end].dot(counts.T).tocsr()
+        # weights of the edges are summed in the order of sentences like in the pairwise rating
+        ranks.sort_indices()
+        ranks = ranks.tocoo()
+
+        rows = ranks.row + start
+        norms = log_lengths[rows] + log_lengths[ranks.col]
+        weights = ranks.data / numpy.where(norms == 0.0, 1.0, norms)
+        weights[(norms == 0.0) | (rows == ranks.col)] = 0.0
+
+        return numpy.bincount(ranks.row, weights=weights, minlength=end - start)
+
     def _to_words_set(self, sentence):
         words = map(self.normalize_word, sentence.words)
-        return [self.stem_word(w) for w in words if w not in self._stop_words]
+        return stem_many(self._stemmer, [w for w in words if w not in self._stop_words])
 
     def _rate_sentences_edge(self, words1, words2):
         rank = 0
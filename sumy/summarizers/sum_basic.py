@@ -3,7 +3,14 @@
 from __future__ import absolute_import
 from __future__ import division, print_function, unicode_literals
 
-from ._summarizer import AbstractSummarizer
+import heapq
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+from ._summarizer import AbstractSummarizer, UNRANKED_RATING
 
 
 class SumBasicSummarizer(AbstractSummarizer):
@@ -13,6 +20,7 @@ class SumBasicSummarizer(AbstractSummarizer):
     Source: http://www.cis.upenn.edu/~nenkova/papers/ipm.pdf
     """
     _stop_words = frozenset()
+    vectorized = False
 
     @property
     def stop_words(self):
@@ -23,10 +31,26 @@ class SumBasicSummarizer(AbstractSummarizer):
         self._stop_words = frozenset(map(self.normalize_word, words))
 
     def __call__(self, document, sentences_count):
+        self._ensure_dependencies_installed()
         sentences = document.sentences
-        ratings = self._compute_ratings(sentences)
+        limit = self._get_items_count(sentences_count, len(sentences))
+        sentences_as_words = self._stem_content_words(document, self._stop_words)
+        word_freq = self._compute_tf(sentences, self._stem_all_words(document))
+        if self.vectorized:
+            ratings = self._compute_ratings_vectorized(sentences, limit, sentences_as_words, word_freq)
+        else:
+            ratings = self._compute_ratings(sentences, limit, sentences_as_words, word_freq)
         return self._get_best_sentences(document.sentences, sentences_count, ratings)
 
+    def _ensure_dependencies_installed(self):
+        if self.vectorized and numpy is None:
+            raise ValueError("Vectorized SumBasic summarizer requires NumPy. Please, install it by command 'pip install numpy'.")
+
+    def _stem_all_words(self, document):
+        """Returns stems of all the words in the sentences taken from the encoded view of the document."""
+        encoded_document = self._get_encoded_document(document)
+        return [s for ids in encoded_document.sentences for s in encoded_document.get_stems(ids)]
+
     def _get_all_words_in_doc(self, sentences):
         return self._stem_words([w for s in sentences for w in s.words])
 
@@ -37,7 +61,7 @@ class SumBasicSummarizer(AbstractSummarizer):
         return stemmed_normalized_content_words
 
     def _stem_words(self, words):
-        return [self.stem_word(w) for w in words]
+        return self.stem_words(words)
 
     def _normalize_words(self, words):
         return [self.normalize_word(w) for w in words]
@@ -52,17 +76,19 @@ class SumBasicSummarizer(AbstractSummarizer):
             word_freq[w] = word_freq.get(w, 0) + 1
         return word_freq
 
-    def _get_all_content_words_in_doc(self, sentences):
-        all_words = self._get_all_words_in_doc(sentences)
+    def _get_all_content_words_in_doc(self, sentences, all_words=None):
+        if all_words is None:
+            all_words = self._get_all_words_in_doc(sentences)
         content_words = self._filter_out_stop_words(all_words)
         normalized_content_words = self._normalize_words(content_words)
         return normalized_content_words
 
-    def _compute_tf(self, sentences):
+    def _compute_tf(self, sentences, all_words=None):
         """
         Computes the normalized term frequency as explained in http://www.tfidf.com/
+        Stems of all the words may be given precomputed by ``all_words``.
         """
-        content_words = self._get_all_content_words_in_doc(sentences)
+        content_words = self._get_all_content_words_in_doc(sentences, all_words)
         content_words_count = len(content_words)
         content_words_freq = self._compute_word_freq(content_words)
         content_word_tf = dict((k, v / content_words_count) for (k, v) in content_words_freq.items())
@@ -95,26 +121,102 @@ class SumBasicSummarizer(AbstractSummarizer):
                 best_sentence_index = i
         return best_sentence_index
 
-    def _compute_ratings(self, sentences):
-        word_freq = self._compute_tf(sentences)
+    def _compute_ratings(self, sentences, limit=None, sentences_as_words=None, word_freq=None):
+        """
+        Rates sentences by the order they are picked. When ``limit`` is given only
+        that many sentences are ranked and the rest is rated by :data:`UNRANKED_RATING`.
+        Content words of the sentences and their frequencies may be given precomputed
+        by ``sentences_as_words`` and ``word_freq``.
+
+        Sentences are kept in a max-heap by their average word probability. Probabilities
+        only decrease so the scores in the heap are upper bounds. Sentences sharing
+        words with the picked one are marked as outdated and rescored lazily when
+        they get on the top of the heap.
+        """
+        if word_freq is None:
+            word_freq = self._compute_tf(sentences)
         ratings = {}
 
-        # make it a list so that it can be modified
-        sentences_list = list(sentences)
-
         # get all content words once for efficiency
-        sentences_as_words = [self._get_content_words_in_sentence(s) for s in sentences]
+        if sentences_as_words is None:
+            sentences_as_words = [self._get_content_words_in_sentence(s) for s in sentences]
+
+        sentences_by_word = {}
+        for i, words in enumerate(sentences_as_words):
+            for w in words:
+                sentences_by_word.setdefault(w, []).append(i)
+
+        # ties are resolved by the sentence order like in the linear search
+        heap = [(-self._compute_average_probability_of_words(word_freq, w), i) for i, w in enumerate(sentences_as_words)]
+        heapq.heapify(heap)
+        outdated = [False] * len(sentences)
 
         # Removes one sentence per iteration by adding to summary
-        while len(sentences_list) > 0:
-            best_sentence_index = self._find_index_of_best_sentence(word_freq, sentences_as_words)
-            best_sentence = sentences_list.pop(best_sentence_index)
+        while heap and (limit is None or len(sentences) - len(heap) < limit):
+            best_sentence_index = heap[0][1]
+            if outdated[best_sentence_index]:
+                outdated[best_sentence_index] = False
+                score = self._compute_average_probability_of_words(word_freq, sentences_as_words[best_sentence_index])
+                heapq.heapreplace(heap, (-score, best_sentence_index))
+                continue
+
+            heapq.heappop(heap)
 
             # value is the iteration in which it was removed multiplied by -1 so that the first sentences removed (the most important) have highest values
-            ratings[best_sentence] = -len(ratings)
+            ratings[sentences[best_sentence_index]] = -len(ratings)
 
             # update probabilities
-            best_sentence_words = sentences_as_words.pop(best_sentence_index)
+            best_sentence_words = sentences_as_words[best_sentence_index]
             self._update_tf(word_freq, best_sentence_words)
 
+            for w in frozenset(best_sentence_words):
+                for i in sentences_by_word[w]:
+                    outdated[i] = True
+
+        for _, i in heap:
+            ratings.setdefault(sentences[i], UNRANKED_RATING)
+
+        return ratings
+
+    def _compute_ratings_vectorized(self, sentences, limit=None, sentences_as_words=None, word_freq=None):
+        """
+        The same as :meth:`_compute_ratings` but word probabilities are kept in NumPy
+        array and all the sentences are rescored at once after every pick.
+        """
+        if word_freq is None:
+            word_freq = self._compute_tf(sentences)
+        if sentences_as_words is None:
+            sentences_as_words = [self._get_content_words_in_sentence(s) for s in sentences]
+
+        vocabulary = {}
+        sentences_as_ids = [[vocabulary.setdefault(w, len(vocabulary)) for w in words] for words in sentences_as_words]
+        probabilities = numpy.empty(len(vocabulary))
+        for w, i in vocabulary.items():
+            probabilities[i] = word_freq[w]
+
+        # sentence x word matrix in COO format with the repeated words kept as separate
+        # items so the sums are accumulated in the same order as in the pure Python code
+        lengths = numpy.array([len(ids) for ids in sentences_as_ids], dtype=numpy.intp)
+        rows = numpy.repeat(numpy.arange(len(sentences)), lengths)
+        columns = numpy.fromiter((i for ids in sentences_as_ids for i in ids), dtype=numpy.intp, count=lengths.sum())
+        divisors = numpy.maximum(lengths, 1)
+
+        ratings = {}
+        picked = numpy.zeros(len(sentences), dtype=bool)
+        for _ in range(len(sentences) if limit is None else min(limit, len(sentences))):
+            scores = numpy.bincount(rows, weights=probabilities[columns], minlength=len(sentences)) / divisors
+            scores[picked] = -numpy.inf
+            best_sentence_index = int(numpy.argmax(scores))
+            picked[best_sentence_index] = True
+
+            # value is the iteration in which it was removed multiplied by -1 so that the first sentences removed (the most important) have highest values
+            ratings[sentences[best_sentence_index]] = -len(ratings)
+
+            # update probabilities
+            for i in sentences_as_ids[best_sentence_index]:
+                probabilities[i] *= probabilities[i]
+
+        for i in numpy.flatnonzero(~picked):
+            ratings.setdefault(sentences[i], UNRANKED_RATING)
+
         return ratings
@@ -10,7 +10,14 @@ try:
 except ImportError:
     numpy = None
 
+try:
+    from scipy import sparse
+except ImportError:
+    sparse = None
+
+from ..nlp.stemmers import stem_many
 from ._summarizer import AbstractSummarizer
+from ._power_method import power_iteration
 
 
 class TextRankSummarizer(AbstractSummarizer):
@@ -20,9 +27,17 @@ class TextRankSummarizer(AbstractSummarizer):
     """
     epsilon = 1e-4
     damping = 0.85
+    max_iterations = 1000
+    # compute weights of all the edges by one product of sparse term-count matrix (requires SciPy)
+    vectorized = False
+    # keep only sparse matrix of weights and apply the damping (teleport) term
+    # inside the power method instead of creating dense matrix (requires SciPy)
+    implicit_teleport = False
     # small number to prevent zero-division error, see https://github.com/miso-belica/sumy/issues/112
     _ZERO_DIVISION_PREVENTION = 1e-7
     _stop_words = frozenset()
+    # report of the power method from the last call of the summarizer
+    convergence_report = None
 
     @property
     def stop_words(self):
@@ -40,14 +55,21 @@ class TextRankSummarizer(AbstractSummarizer):
         ratings = self.rate_sentences(document)
         return self._get_best_sentences(document.sentences, sentences_count, ratings)
 
-    @staticmethod
-    def _ensure_dependencies_installed():
+    def _ensure_dependencies_installed(self):
         if numpy is None:
             raise ValueError("LexRank summarizer requires NumPy. Please, install it by command 'pip install numpy'.")
+        if (self.vectorized or self.implicit_teleport) and sparse is None:
+            raise ValueError("Vectorized TextRank summarizer requires SciPy. Please, install it by command 'pip install scipy'.")
 
     def rate_sentences(self, document):
-        matrix = self._create_matrix(document)
-        ranks = self.power_method(matrix, self.epsilon)
+        if self.implicit_teleport:
+            matrix = self._create_sparse_matrix(document)
+            ranks, self.convergence_report = power_iteration(matrix, self.epsilon, self.max_iterations,
+                damping=self.damping)
+        else:
+            matrix = self._create_matrix(document)
+            ranks, self.convergence_report = power_iteration(matrix, self.epsilon, self.max_iterations)
+
         return {sent: rank for sent, rank in zip(document.sentences, ranks)}
 
     def _create_matrix(self, document):
@@ -60,15 +82,18 @@ class TextRankSummarizer(AbstractSummarizer):
         uses PageRank algorithm with damping, so a damping factor is incorporated as explained in
         TextRank's paper. The resulting matrix is a stochastic matrix ready for power method.
         """
-        sentences_as_words = [self._to_words_set(sent) for sent in document.sentences]
+        sentences_as_words = self._stem_content_words(document, self._stop_words)
         sentences_count = len(sentences_as_words)
-        weights = numpy.zeros((sentences_count, sentences_count))
+        if self.vectorized:
+            weights = self._create_sparse_weights(sentences_as_words).toarray()
+        else:
+            weights = numpy.zeros((sentences_count, sentences_count))
 
-        for i, words_i in enumerate(sentences_as_words):
-            for j in range(i, sentences_count):
-                rating = self._rate_sentences_edge(words_i, sentences_as_words[j])
-                weights[i, j] = rating
-                weights[j, i] = rating
+            for i, words_i in enumerate(sentences_as_words):
+                for j in range(i, sentences_count):
+                    rating = self._rate_sentences_edge(words_i, sentences_as_words[j])
+                    weights[i, j] = rating
+                    weights[j, i] = rating
 
         weights /= (weights.sum(axis=1)[:, numpy.newaxis] + self._ZERO_DIVISION_PREVENTION)
 
@@ -80,9 +105,49 @@ class TextRankSummarizer(AbstractSummarizer):
         return numpy.full((sentences_count, sentences_count), (1.-self.damping) / sentences_count) \
             + self.damping * weights
 
+    def _create_sparse_matrix(self, document):
+        """
+        Creates sparse matrix of normalized weights of the edges. It's the matrix
+        from :meth:`_create_matrix` without the damping, so the damping has to be
+        applied by the power method.
+        """
+        sentences_as_words = self._stem_content_words(document, self._stop_words)
+        weights = self._create_sparse_weights(sentences_as_words)
+
+        degrees = numpy.asarray(weights.sum(axis=1)).ravel() + self._ZERO_DIVISION_PREVENTION
+        return sparse.diags(1.0 / degrees).dot(weights).tocsr()
+
     def _to_words_set(self, sentence):
         words = map(self.normalize_word, sentence.words)
-        return [self.stem_word(w) for w in words if w not in self._stop_words]
+        return stem_many(self._stemmer, [w for w in words if w not in self._stop_words])
+
+    @staticmethod
+    def _create_sparse_weights(sentences_as_words):
+        """
+        Computes the same weights as :meth:`_rate_sentences_edge` for all the pairs
+        of sentences at once. Numbers of common words are given by the product
+        of sparse matrix |sentences|×|terms| of term counts with its transposition.
+        """
+        terms = {}
+        rows, cols = [], []
+        for row, words in enumerate(sentences_as_words):
+            for word in words:
+                rows.append(row)
+                cols.append(terms.setdefault(word, len(terms)))
+
+        shape = (len(sentences_as_words), len(terms))
+        counts = sparse.csr_matrix((numpy.ones(len(rows)), (rows, cols)), shape=shape)
+        ranks = counts.dot(counts.T).tocoo()
+
+        # logarithms by the module `math` to get exactly the same results as the pairwise rating
+        log_lengths = numpy.array([math.log(len(words)) if words else 0.0 for words in sentences_as_words])
+        norms = log_lengths[ranks.row] + log_lengths[ranks.col]
+
+        # sentences with a single word have zero norm and their weight is the rank itself
+        zero_norms = numpy.isclose(norms, 0.)
+        values = ranks.data / numpy.where(zero_norms, 1.0, norms)
+
+        return sparse.csr_matrix((values, (ranks.row, ranks.col)), shape=ranks.shape)
 
     @staticmethod
     def _rate_sentences_edge(words1, words2):
@@ -101,15 +166,6 @@ class TextRankSummarizer(AbstractSummarizer):
             return rank / norm
 
     @staticmethod
-    def power_method(matrix, epsilon):
-        transposed_matrix = matrix.T
-        sentences_count = len(matrix)
-        p_vector = numpy.array([1.0 / sentences_count] * sentences_count)
-        lambda_val = 1.0
-
-        while lambda_val > epsilon:
-            next_p = numpy.dot(transposed_matrix, p_vector)
-            lambda_val = numpy.linalg.norm(numpy.subtract(next_p, p_vector))
-            p_vector = next_p
-
+    def power_method(matrix, epsilon, max_iterations=max_iterations, initial_vector=None):
+        p_vector, _ = power_iteration(matrix, epsilon, max_iterations, initial_vector)
         return p_vector
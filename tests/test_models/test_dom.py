@@ -2,10 +2,14 @@
 
 from __future__ import absolute_import, division, print_function, unicode_literals
 
+import copy
+import pickle
+
 import pytest
 
 from sumy._compat import to_unicode
 from sumy.models.dom import Paragraph, Sentence
+from sumy.nlp.stemmers import null_stemmer
 from sumy.nlp.tokenizers import Tokenizer
 from ..utils import build_document, build_document_from_string
 
@@ -91,3 +95,89 @@ def test_sentences_with_same_words_in_different_order_are_different():
     sentence2 = Sentence("another word", Tokenizer("czech"))
 
     assert sentence1 != sentence2
+
+
+def test_encoded_document():
+    document = build_document_from_string("""
+        # Heading Dog
+        The dog chases the cat
+        Dogs and cats
+    """)
+
+    encoded_document = document.encode(lambda w: w.rstrip("s"))
+    stop_words = frozenset(["the", "and"])
+
+    assert encoded_document.words == ("heading", "dog", "the", "chases", "cat", "dogs", "and", "cats")
+    assert encoded_document.stems == ("heading", "dog", "the", "chase", "cat", "and")
+    assert encoded_document.headings == ((0, 1),)
+    assert encoded_document.sentences == ((2, 1, 3, 2, 4), (5, 6, 7))
+    assert encoded_document.get_stop_words_mask(stop_words) == (False, False, True, False, False, False, True, False)
+    assert encoded_document.get_words((5, 6, 7)) == ["dogs", "and", "cats"]
+    assert encoded_document.get_words((5, 6, 7), stop_words) == ["dogs", "cats"]
+    assert encoded_document.get_stems((2, 1, 3, 2, 4), stop_words) == ["dog", "chase", "cat"]
+
+
+def test_encoded_document_is_cached_by_stemmer():
+    document = build_document(("Some sentence", "Another sentence"))
+
+    def stemmer(word):
+        return word
+
+    encoded_document = document.encode(stemmer)
+
+    assert document.encode(stemmer) is encoded_document
+    assert document.encode(lambda w: w) is not encoded_document
+
+
+def test_encoded_document_stems_words_lazily():
+    document = build_document(("Some sentence", "Another SENTENCE"))
+    stemmed_words = []
+
+    def stemmer(word):
+        stemmed_words.append(word)
+        return word
+
+    encoded_document = document.encode(stemmer)
+    assert encoded_document.get_words(encoded_document.sentences[1], ["another"]) == ["sentence"]
+    assert stemmed_words == []
+
+    assert encoded_document.get_stems(encoded_document.sentences[1]) == ["another", "sentence"]
+    assert encoded_document.get_stems(encoded_document.sentences[0], ["some"]) == ["sentence"]
+    assert stemmed_words == ["some", "sentence", "another"]
+
+
+@pytest.mark.parametrize("copy_document", [
+    lambda d: pickle.loads(pickle.dumps(d)),
+    copy.deepcopy,
+])
+def test_encoded_document_is_not_copied(copy_document):
+    document = build_document_from_string("""
+        # Heading Dog
+        The dog chases the cat
+        Dogs and cats
+    """)
+    encoded_document = document.encode(lambda w: w.rstrip("s"))
+
+    document_copy = copy_document(document)
+
+    assert [to_unicode(s) for s in document_copy.sentences] == [to_unicode(s) for s in document.sentences]
+    assert [to_unicode(h) for h in document_copy.headings] == [to_unicode(h) for h in document.headings]
+    assert document_copy._encoded_documents == {}
+    assert document_copy.encode(lambda w: w.rstrip("s")).stems == encoded_document.stems
+
+
+@pytest.mark.parametrize("copy_encoded_document", [
+    lambda d: pickle.loads(pickle.dumps(d)),
+    copy.deepcopy,
+])
+def test_encoded_document_copy(copy_encoded_document):
+    document = build_document(("Some sentence", "Another SENTENCE"))
+    encoded_document = document.encode(null_stemmer)
+    encoded_document.get_stop_words_mask(["some"])
+
+    encoded_copy = copy_encoded_document(encoded_document)
+
+    assert encoded_copy.words == encoded_document.words
+    assert encoded_copy.sentences == encoded_document.sentences
+    assert encoded_copy.get_stems(encoded_copy.sentences[0], ["some"]) == ["sentence"]
+    assert encoded_copy.stems == encoded_document.stems
@@ -0,0 +1,126 @@
+# -*- coding: utf-8 -*-
+
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+import math
+
+import numpy
+import pytest
+
+import sumy.models.idf as idf_module
+from sumy.models import IdfTable
+from sumy.summarizers.lex_rank import LexRankSummarizer
+from ..utils import build_document
+
+
+def build_corpus():
+    return [
+        build_document(("Hello world.", "This is the first document.",)),
+        build_document(("Hello again, world.",)),
+        build_document(("Šťastný nový rok.",)),
+    ]
+
+
+def test_numpy_not_installed(monkeypatch):
+    monkeypatch.setattr(idf_module, "numpy", None)
+
+    with pytest.raises(ValueError):
+        IdfTable.from_documents(build_corpus())
+
+
+def test_idf_values():
+    table = IdfTable.from_documents(build_corpus(), stop_words=("Is", "the",))
+
+    assert len(table) == 9
+    assert table["hello"] == pytest.approx(math.log(3/3))
+    assert table["šťastný"] == pytest.approx(math.log(3/2))
+    assert table["missing"] == pytest.approx(math.log(3))
+    assert "hello" in table
+    assert "is" not in table
+    assert "" not in table
+
+
+def test_idf_metrics_for_many_terms():
+    table = IdfTable.from_documents(build_corpus())
+
+    metrics = table.idf_metrics(["world", "missing", "first", "zzz"])
+
+    assert metrics == pytest.approx({
+        "world": math.log(3/3),
+        "missing": math.log(3),
+        "first": math.log(3/2),
+        "zzz": math.log(3),
+    })
+
+
+def test_empty_corpus():
+    table = IdfTable.from_documents([])
+
+    assert len(table) == 0
+    assert table["word"] == 0.0
+
+
+def test_wrong_arrays():
+    terms = numpy.frombuffer(b"a", dtype=numpy.uint8)
+
+    with pytest.raises(ValueError):
+        IdfTable(terms, numpy.array([0, 0, 1]), numpy.array([1.0]))
+
+    with pytest.raises(ValueError):
+        IdfTable(terms, numpy.array([0, 1]), numpy.array([1.0]))
+
+    with pytest.raises(ValueError):
+        IdfTable(terms, numpy.array([0, 0, 2]), numpy.array([1.0, 1.0]))
+
+
+def test_terms_are_not_padded_to_the_longest_one():
+    long_term = "x" * 10000
+    corpus = build_corpus() + [build_document(("Hello " + long_term,))]
+
+    table = IdfTable.from_documents(corpus)
+
+    assert len(table) == 12
+    assert table[long_term] == pytest.approx(math.log(4/2))
+    assert table["hello"] == pytest.approx(math.log(4/4))
+    assert table._terms.buffer.nbytes < len(long_term) + 100
+
+
+def test_save_and_load_memory_mapped(tmpdir):
+    table = IdfTable.from_documents(build_corpus())
+    path = str(tmpdir.join("idf"))
+    table.save(path)
+
+    loaded = IdfTable.load(path)
+
+    assert len(loaded) == len(table)
+    assert isinstance(loaded._values, numpy.memmap)
+    assert loaded["šťastný"] == table["šťastný"]
+    assert loaded["missing"] == table["missing"]
+    assert "world" in loaded
+    assert "missing" not in loaded
+
+
+def test_lex_rank_with_idf_table():
+    document = build_document(
+        ("I am the sentence you like", "Do you like me?",),
+        ("This sentence is better than that above", "Are you kidding me?",),
+    )
+    summarizer = LexRankSummarizer()
+    summarizer.idf_table = IdfTable.from_documents(build_corpus() + [document])
+
+    sentences_words = [summarizer._to_words_set(s) for s in document.sentences]
+    idf_metrics = summarizer._compute_idf(sentences_words, idf_table=summarizer.idf_table)
+    assert idf_metrics["sentence"] == pytest.approx(math.log(4/2))
+
+    sentences = summarizer(document, 2)
+    assert len(sentences) == 2
+
+
+def test_save_and_load_empty_table(tmpdir):
+    path = str(tmpdir.join("idf"))
+    IdfTable.from_documents([]).save(path)
+
+    loaded = IdfTable.load(path)
+
+    assert len(loaded) == 0
+    assert loaded["word"] == 0.0
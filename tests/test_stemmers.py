@@ -6,7 +6,9 @@ from __future__ import absolute_import, division, print_function, unicode_litera
 
 import pytest
 
-from sumy.nlp.stemmers import null_stemmer, Stemmer
+from multiprocessing.pool import ThreadPool
+
+from sumy.nlp.stemmers import null_stemmer, stem_many, Stemmer
 
 
 def test_missing_stemmer_language():
@@ -56,3 +58,80 @@ def test_greek_stemmer():
 def test_swedish_stemmer():
     swedish_stemmer = Stemmer("swedish")
     assert "sov" == swedish_stemmer("sover")
+
+
+def test_stemmer_without_cache():
+    stemmer = Stemmer("english")
+
+    assert stemmer("beautiful") == "beauti"
+    assert stemmer("beautiful") == "beauti"
+    assert stemmer.cache_info() == (0, 0, 0, 0)
+
+
+def test_stemmer_with_negative_cache_size():
+    with pytest.raises(ValueError):
+        Stemmer("english", cache_size=-1)
+
+
+def test_cached_stemmer():
+    stemmer = Stemmer("english", cache_size=2)
+
+    assert stemmer("beautiful") == "beauti"
+    assert stemmer("beautiful") == "beauti"
+    assert stemmer("running") == "run"
+    assert stemmer.cache_info() == (1, 2, 2, 2)
+
+    # "beautiful" is the most recently used word so "running" is evicted
+    assert stemmer("beautiful") == "beauti"
+    assert stemmer("flies") == "fli"
+    assert stemmer("running") == "run"
+    assert stemmer.cache_info() == (2, 4, 2, 2)
+
+    stemmer.cache_clear()
+    assert stemmer.cache_info() == (0, 0, 2, 0)
+
+
+def test_cached_stemmer_shared_by_threads():
+    stemmer = Stemmer("czech", cache_size=50)
+    words = ["pěkný", "pěkná", "pěkné", "jablko", "jablka", "zahrada", "zahrady"] * 20
+    expected = [Stemmer("czech")(w) for w in words]
+
+    def stem_words(_):
+        return [stemmer(w) for w in words]
+
+    pool = ThreadPool(4)
+    try:
+        results = pool.map(stem_words, range(8))
+    finally:
+        pool.close()
+        pool.join()
+
+    assert all(r == expected for r in results)
+    hits, misses, _, currsize = stemmer.cache_info()
+    assert hits + misses == 8 * len(words)
+    assert currsize == 7
+
+
+def test_stem_many_stems_every_word_once():
+    stemmer = Stemmer("english", cache_size=10)
+    words = ["running", "flies", "running", "beautiful", "flies", "running"]
+
+    assert stemmer.stem_many(words) == ["run", "fli", "run", "beauti", "fli", "run"]
+    assert stemmer.cache_info().misses == 3
+    assert stemmer.cache_info().hits == 0
+
+
+def test_stem_many_with_callable_stemmer():
+    stemmed_words = []
+
+    def stemmer(word):
+        stemmed_words.append(word)
+        return null_stemmer(word)
+
+    assert stem_many(stemmer, iter(["A", "b", "A", "c", "b"])) == ["a", "b", "a", "c", "b"]
+    assert stemmed_words == ["A", "b", "c"]
+
+
+def test_stem_many_of_no_words():
+    assert stem_many(null_stemmer, []) == []
+    assert Stemmer("czech").stem_many(()) == []
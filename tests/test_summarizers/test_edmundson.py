@@ -5,6 +5,8 @@ from __future__ import absolute_import, division, print_function, unicode_litera
 import pytest
 
 from sumy._compat import to_unicode
+from sumy.nlp.stemmers import null_stemmer
+import sumy.summarizers.edmundson as edmundson_module
 from sumy.summarizers.edmundson import EdmundsonSummarizer
 from ..utils import build_document, build_document_from_string
 
@@ -447,3 +449,162 @@ def test_location_method_2():
         "hb hc hd = 3 + 1 + 0 = 4",
         "ha hb = 2 + 1 + 0 = 3",
     ]
+
+
+def test_methods_share_stems_of_words():
+    stemmed_words = []
+
+    def stemmer(word):
+        stemmed_words.append(word)
+        return word
+
+    document = build_document_from_string("""
+        # This is cool heading
+        Because I am sentence I like words
+        And because I am string I like characters
+
+        # blank and heading
+        This is next paragraph because of blank line above
+        Here is the winner because contains words like cool and heading
+    """)
+    summarizer = EdmundsonSummarizer(stemmer, cue_weight=1, key_weight=1, title_weight=1, location_weight=1)
+    summarizer.bonus_words = ("cool", "heading", "sentence", "words", "like", "because")
+    summarizer.stigma_words = ("this", "is", "I", "am", "and",)
+    summarizer.null_words = ("this", "is", "and", "of")
+    del stemmed_words[:]
+
+    sentences = summarizer(document, 2)
+
+    assert len(sentences) == 2
+    assert sorted(stemmed_words) == sorted(frozenset(w.lower() for w in document.words))
+
+
+@pytest.mark.parametrize("weights, headings_stemmed", [
+    ((1, 0, 0, 0), False),
+    ((1, 1, 0, 0), True),
+    ((0, 0, 1, 0), True),
+    ((0, 0, 0, 1), True),
+])
+def test_headings_are_stemmed_only_for_methods_using_them(monkeypatch, weights, headings_stemmed):
+    document = build_document_from_string("""
+        # This is cool heading
+        Because I am sentence I like words
+
+        # blank and heading
+        Here is the winner because contains words like cool and heading
+    """)
+    summarizer = EdmundsonSummarizer(null_stemmer, *weights)
+    summarizer.bonus_words = ("cool", "heading", "words")
+    summarizer.stigma_words = ("this", "is")
+    summarizer.null_words = ("this", "is", "and")
+
+    stemmed_sentences = []
+    stem_sentences = summarizer._stem_sentences
+
+    def record_stemmed_sentences(document, headings=True):
+        stems = stem_sentences(document, headings)
+        stemmed_sentences.extend(stems)
+        return stems
+
+    monkeypatch.setattr(summarizer, "_stem_sentences", record_stemmed_sentences)
+    summarizer(document, 1)
+
+    expected = document.sentences + (document.headings if headings_stemmed else ())
+    assert sorted(stemmed_sentences, key=repr) == sorted(expected, key=repr)
+
+
+def _build_weighted_summarizer(weighted, *weights):
+    summarizer = EdmundsonSummarizer(null_stemmer, *weights)
+    summarizer.weighted = weighted
+    summarizer.bonus_words = ("cool", "heading", "sentence", "words", "like", "because")
+    summarizer.stigma_words = ("this", "is", "I", "am", "and",)
+    summarizer.null_words = ("this", "is", "and", "of")
+    return summarizer
+
+
+def _build_sweep_document():
+    return build_document_from_string("""
+        # This is cool heading
+        Because I am sentence I like words
+        And because I am string I like characters
+
+        # blank and heading
+        This is next paragraph because of blank line above
+        Here is the winner because contains words like cool and heading
+    """)
+
+
+def test_weights_only_switch_methods_on_by_default():
+    document = _build_sweep_document()
+    expected = _build_weighted_summarizer(False, 1, 1, 1, 1)(document, 2)
+
+    assert _build_weighted_summarizer(False, 5, 0.1, 2, 1)(document, 2) == expected
+
+
+def test_weighted_methods():
+    document = _build_sweep_document()
+    summarizer = _build_weighted_summarizer(True, 0.5, 2, 0, 1)
+
+    cue, key, _, location = summarizer._rate_sentences_by_methods(document, (True, True, False, True))
+    ratings = dict((s, 0.5*c + 2*k + l) for s, c, k, l in zip(document.sentences, cue, key, location))
+
+    assert summarizer(document, 2) == summarizer._get_best_sentences(document.sentences, 2, ratings)
+
+
+def test_sweep_weights():
+    document = _build_sweep_document()
+    weights = [
+        (1, 0, 1, 1),
+        (0, 1, 0, 0),
+        (0.5, 2, 0, 1),
+        (0, 0, 3, 0.1),
+    ]
+
+    summaries = _build_weighted_summarizer(False).sweep_weights(document, 2, weights, weighted=True)
+
+    assert summaries == [_build_weighted_summarizer(True, *w)(document, 2) for w in weights]
+    assert _build_weighted_summarizer(True).sweep_weights(document, 2, weights) == summaries
+
+
+def test_sweep_switched_methods():
+    document = _build_sweep_document()
+    weights = [
+        (1, 0, 1, 1),
+        (0, 1, 0, 0),
+        (1, 1, 0, 1),
+        (1, 1, 1, 1),
+    ]
+
+    summaries = _build_weighted_summarizer(False).sweep_weights(document, 2, weights)
+
+    assert summaries == [_build_weighted_summarizer(False, *w)(document, 2) for w in weights]
+    assert _build_weighted_summarizer(True).sweep_weights(document, 2, weights, weighted=False) == summaries
+
+
+def test_sweep_weights_of_switched_methods_are_0_or_1():
+    summarizer = _build_weighted_summarizer(False)
+
+    with pytest.raises(ValueError):
+        summarizer.sweep_weights(_build_sweep_document(), 2, [(1, 0, 1, 1), (0.5, 2, 0, 1)])
+
+
+@pytest.mark.parametrize("weights", [
+    [(1, 1, 1)],
+    [(1, 1, 1, 1, 1)],
+    (1, 1, 1, 1),
+    [(1, 1, -1, 1)],
+])
+def test_sweep_weights_with_wrong_weights(weights):
+    summarizer = _build_weighted_summarizer(False)
+
+    with pytest.raises(ValueError):
+        summarizer.sweep_weights(build_document(), 10, weights)
+
+
+def test_numpy_not_installed_for_sweep_weights(monkeypatch):
+    summarizer = _build_weighted_summarizer(False)
+
+    monkeypatch.setattr(edmundson_module, "numpy", None)
+
+    with pytest.raises(ValueError):
+        summarizer.sweep_weights(build_document(), 10, [(1, 1, 1, 1)])
@@ -0,0 +1,157 @@
+# -*- coding: utf-8 -*-
+
+from __future__ import absolute_import
+from __future__ import division, print_function, unicode_literals
+
+import pytest
+
+from sumy.summarizers.edmundson import EdmundsonSummarizer
+from sumy.summarizers.ensemble import EnsembleSummarizer
+from sumy.summarizers.kl import KLSummarizer
+from sumy.summarizers.lex_rank import LexRankSummarizer
+from sumy.summarizers.lsa import LsaSummarizer
+from sumy.summarizers.luhn import LuhnSummarizer
+from sumy.summarizers.text_rank import TextRankSummarizer
+from sumy.nlp.stemmers import Stemmer
+from ..utils import build_document
+
+
+STOP_WORDS = ("a", "the", "is", "and", "of", "in", "on")
+
+
+def _build_document():
+    return build_document(
+        ("Cats are small furry animals", "The cat is sleeping on the sofa", "Dogs and cats are friends"),
+        ("The dog is barking in the garden", "Small dogs are loud animals", "Birds sing in the morning"),
+        ("A cat and a dog in the garden", "Morning birds wake the cat", "The sofa is soft"),
+    )
+
+
+def _build_summarizers(stemmer):
+    summarizers = (LexRankSummarizer(stemmer), TextRankSummarizer(stemmer), LsaSummarizer(stemmer))
+    for summarizer in summarizers:
+        summarizer.stop_words = STOP_WORDS
+
+    return summarizers
+
+
+def test_without_summarizers():
+    with pytest.raises(ValueError):
+        EnsembleSummarizer(())
+
+
+def test_not_callable_summarizer():
+    with pytest.raises(ValueError):
+        EnsembleSummarizer((LuhnSummarizer(), "lsa"))
+
+
+def test_wrong_count_of_weights():
+    with pytest.raises(ValueError):
+        EnsembleSummarizer((LuhnSummarizer(), KLSummarizer()), weights=(1.0,))
+
+
+def test_negative_weight():
+    with pytest.raises(ValueError):
+        EnsembleSummarizer((LuhnSummarizer(), KLSummarizer()), weights=(1.0, -0.5))
+
+
+def test_unknown_fusion():
+    summarizer = EnsembleSummarizer((LuhnSummarizer(),))
+    summarizer.fusion = "majority"
+
+    with pytest.raises(ValueError):
+        summarizer(_build_document(), 2)
+
+
+def test_empty_document():
+    document = build_document()
+    summarizer = EnsembleSummarizer(_build_summarizers(Stemmer("english")))
+
+    assert summarizer(document, 10) == ()
+
+
+@pytest.mark.parametrize("fusion", EnsembleSummarizer.FUSIONS)
+def test_single_summarizer(fusion):
+    document = _build_document()
+    text_rank = TextRankSummarizer(Stemmer("english"))
+    text_rank.stop_words = STOP_WORDS
+    summarizer = EnsembleSummarizer((text_rank,))
+    summarizer.fusion = fusion
+
+    assert summarizer(document, "34%") == text_rank(document, "34%")
+
+
+def test_zero_weight_ignores_summarizer():
+    document = _build_document()
+    stemmer = Stemmer("english")
+    lex_rank, text_rank, lsa = _build_summarizers(stemmer)
+
+    summarizer = EnsembleSummarizer((lex_rank, lsa), weights=(0.0, 1.0))
+    assert summarizer(document, 3) == lsa(document, 3)
+
+
+def test_greedy_summarizer_rates_all_sentences():
+    document = _build_document()
+    ratings = EnsembleSummarizer._rate_sentences_by(KLSummarizer(), document)
+
+    assert sorted(ratings, reverse=True) == [-i for i in range(len(document.sentences))]
+
+
+def test_borda_points():
+    points = EnsembleSummarizer._compute_borda_points([0.5, 2.0, 0.1, 2.0, 1.0])
+    assert points == [1.0, 3.5, 0.0, 3.5, 2.0]
+
+
+def test_normalized_ratings():
+    ratings = EnsembleSummarizer._normalize_ratings([2.0, 4.0, 3.0, float("-inf")])
+    assert ratings == [0.0, 1.0, 0.5, 0.0]
+
+    assert EnsembleSummarizer._normalize_ratings([3.0, 3.0]) == [1.0, 1.0]
+    assert EnsembleSummarizer._normalize_ratings([float("-inf")]) == [0.0]
+
+
+def test_fused_ratings():
+    document = _build_document()
+    summarizers = _build_summarizers(Stemmer("english"))
+    summarizer = EnsembleSummarizer(summarizers, weights=(1.0, 2.0, 0.5))
+
+    expected = [0.0] * len(document.sentences)
+    for weight, s in zip(summarizer.weights, summarizers):
+        points = EnsembleSummarizer._compute_borda_points(EnsembleSummarizer._rate_sentences_by(s, document))
+        expected = [e + weight*p for e, p in zip(expected, points)]
+
+    assert summarizer.rate_sentences(document) == pytest.approx(expected)
+
+
+@pytest.mark.parametrize("fusion", EnsembleSummarizer.FUSIONS)
+def test_summarizers_in_threads(fusion):
+    summarizer = EnsembleSummarizer(_build_summarizers(Stemmer("english")))
+    summarizer.fusion = fusion
+    expected = summarizer(_build_document(), 3)
+
+    summarizer.workers = 3
+    assert summarizer(_build_document(), 3) == expected
+    assert len(expected) == 3
+
+
+def test_shared_stemming():
+    stemmer = Stemmer("english", cache_size=1000)
+    document = _build_document()
+
+    luhn = LuhnSummarizer(stemmer)
+    luhn.stop_words = ("the", "a")
+    edmundson = EdmundsonSummarizer(stemmer)
+    edmundson.bonus_words = ("cat", "dog")
+    edmundson.stigma_words = ("sofa",)
+    edmundson.null_words = STOP_WORDS
+
+    summarizer = EnsembleSummarizer(_build_summarizers(stemmer) + (luhn, edmundson, KLSummarizer(stemmer)))
+    summarizer.workers = 3
+    # Edmundson stems its bonus, stigma and null words when they are set
+    stemmer.cache_clear()
+    summarizer(document, 3)
+
+    assert len(document._encoded_documents) == 1
+    words = set(w.lower() for w in document.words)
+    assert stemmer.cache_info().misses == len(words)
+    assert stemmer.cache_info().hits == 0
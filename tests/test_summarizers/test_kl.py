@@ -7,7 +7,9 @@ import pytest
 
 from sumy.models.dom._sentence import Sentence
 from sumy.nlp.tokenizers import Tokenizer
+import sumy.summarizers.kl as kl_module
 from sumy.summarizers.kl import KLSummarizer
+from sumy.summarizers._summarizer import UNRANKED_RATING
 from ..utils import build_document
 
 
@@ -146,3 +148,89 @@ def test_the_sentences_should_be_in_different_order(summarizer):
     reversed_sentences = summarizer(reversed_document, "100%")
 
     assert tuple(reversed(sentences)) == reversed_sentences
+
+
+def _compute_ratings_directly(summarizer, sentences):
+    """Reference greedy selection recomputing divergence of every candidate from scratch."""
+    word_freq = summarizer.compute_tf(sentences)
+    remaining = list(sentences)
+    summary = []
+    ratings = {}
+    while remaining:
+        summary_words = [w for s in summary for w in s.words]
+        kls = [summarizer._kl_divergence(
+            summarizer._joint_freq(summarizer._get_content_words_in_sentence(s), summary_words), word_freq)
+            for s in remaining]
+        best_sentence = remaining.pop(kls.index(min(kls)))
+        summary.append(best_sentence)
+        ratings[best_sentence] = -1 * len(ratings)
+
+    return ratings
+
+
+def test_incremental_ratings_are_same_as_direct_ratings(summarizer):
+    document = build_document(
+        ("The quick brown fox jumps over the lazy dog.", "I am the sentence you like and I like you."),
+        ("The fox is quick and the dog is lazy.", "Jumps over everything.", "Brown dog."),
+        ("Fox.", "Dog.", "Quick quick quick fox and the lazy dog."),
+        ("The the and.", "I like the brown lazy dog and the quick fox."),
+    )
+
+    ratings = summarizer._compute_ratings(document.sentences)
+
+    assert ratings == _compute_ratings_directly(summarizer, document.sentences)
+
+
+@pytest.mark.parametrize("sentences_count", [1, 3, "50%", 100])
+def test_ratings_stopped_early_keep_order_of_ranked_sentences(summarizer, sentences_count):
+    document = build_document(
+        ("The quick brown fox jumps over the lazy dog.", "I am the sentence you like and I like you."),
+        ("The fox is quick and the dog is lazy.", "Jumps over everything.", "Brown dog."),
+        ("Fox.", "Dog.", "Quick quick quick fox and the lazy dog."),
+    )
+    sentences = document.sentences
+    limit = summarizer._get_items_count(sentences_count, len(sentences))
+
+    all_ratings = summarizer._compute_ratings(sentences)
+    ratings = summarizer._compute_ratings(sentences, limit)
+
+    ranked = [s for s in sentences if ratings[s] != UNRANKED_RATING]
+    assert len(ranked) == min(limit, len(sentences))
+    assert all(ratings[s] == all_ratings[s] for s in ranked)
+    assert summarizer(document, sentences_count) == summarizer._get_best_sentences(sentences, sentences_count, all_ratings)
+
+
+@pytest.mark.parametrize("limit", [None, 2])
+def test_vectorized_ratings_are_same_as_ratings(summarizer, limit):
+    document = build_document(
+        ("The quick brown fox jumps over the lazy dog.", "I am the sentence you like and I like you."),
+        ("The fox is quick and the dog is lazy.", "Jumps over everything.", "Brown dog."),
+        ("Fox.", "Dog.", "Quick quick quick fox and the lazy dog."),
+        ("The the and.", "I like the brown lazy dog and the quick fox."),
+    )
+
+    ratings = summarizer._compute_ratings_vectorized(document.sentences, limit)
+
+    assert ratings == summarizer._compute_ratings(document.sentences, limit)
+
+
+@pytest.mark.parametrize("limit", [None, 0, 1])
+@pytest.mark.parametrize("sentence", ["I am one slightly longer sentence.", "The and I.", ""])
+def test_vectorized_ratings_of_single_sentence(summarizer, sentence, limit):
+    document = build_document([Sentence(sentence, Tokenizer("english"))])
+    sentences_as_words = summarizer._get_content_words(document)
+
+    ratings = summarizer._compute_ratings_vectorized(document.sentences, limit, sentences_as_words)
+
+    assert ratings == summarizer._compute_ratings(document.sentences, limit, sentences_as_words)
+    assert ratings == summarizer._compute_ratings_vectorized(document.sentences, limit)
+    assert list(ratings.values()) == [UNRANKED_RATING if limit == 0 else 0]
+
+
+def test_numpy_not_installed_for_vectorized_summarizer(monkeypatch, summarizer):
+    summarizer.vectorized = True
+
+    monkeypatch.setattr(kl_module, "numpy", None)
+
+    with pytest.raises(ValueError):
+        summarizer(build_document(), 10)
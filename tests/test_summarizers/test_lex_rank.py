@@ -3,11 +3,16 @@
 from __future__ import absolute_import
 from __future__ import division, print_function, unicode_literals
 
+import json
 import math
+import os
+import subprocess
+import sys
 
 import numpy
 import pytest
 
+import sumy
 import sumy.summarizers.lex_rank as lex_rank_module
 from sumy.nlp.stemmers.czech import stem_word
 from sumy.nlp.tokenizers import Tokenizer
@@ -75,6 +80,42 @@ def test_idf_metrics():
     assert expected == metrics
 
 
+def test_inverted_index():
+    summarizer = LexRankSummarizer()
+
+    sentences = [
+        ("this", "sentence", "is", "simple", "sentence",),
+        ("this", "is", "too", "too",),
+        (),
+        ("yes",),
+    ]
+    inverted_index = summarizer._create_inverted_index(sentences)
+
+    expected = {
+        "this": [0, 1],
+        "sentence": [0],
+        "is": [0, 1],
+        "simple": [0],
+        "too": [1],
+        "yes": [3],
+    }
+    assert expected == inverted_index
+
+
+def test_idf_metrics_from_inverted_index():
+    summarizer = LexRankSummarizer()
+
+    sentences = [
+        ("this", "sentence", "is", "simple", "sentence",),
+        ("this", "is", "too", "too",),
+        (),
+    ]
+    inverted_index = summarizer._create_inverted_index(sentences)
+
+    assert summarizer._compute_idf(sentences) == summarizer._compute_idf(sentences, inverted_index)
+    assert LexRankSummarizer._compute_idf(sentences) == summarizer._compute_idf(sentences)
+
+
 def test_cosine_similarity_for_the_same_sentence_with_duplicate_words_should_be_one():
     """
     We compute similarity of the same sentences. These should be exactly the same and
@@ -181,4 +222,357 @@ def test_power_method_should_return_finite():
     ])
     scores = LexRankSummarizer.power_method(matrix, LexRankSummarizer.epsilon)
 
-    assert all(numpy.isfinite(scores))
\ No newline at end of file
+    assert all(numpy.isfinite(scores))
+
+
+def test_scipy_not_installed_for_vectorized_summarizer(monkeypatch):
+    summarizer = LexRankSummarizer()
+    summarizer.vectorized = True
+
+    monkeypatch.setattr(lex_rank_module, "sparse", None)
+
+    with pytest.raises(ValueError):
+        summarizer(build_document(), 10)
+
+
+def test_sparse_matrix_is_same_as_dense_matrix():
+    summarizer = LexRankSummarizer()
+    sentences = [
+        ["this", "sentence", "is", "simple", "sentence"],
+        ["this", "is", "simple", "sentence", "yes", "is", "too", "too", "too"],
+        ["not", "every", "sentence", "makes", "me", "happy"],
+        ["yes"],
+        [],
+        ["every", "day", "is", "happy", "day"],
+    ]
+    tf_metrics = summarizer._compute_tf(sentences)
+    idf_metrics = summarizer._compute_idf(sentences)
+
+    expected = summarizer._create_matrix(sentences, 0.1, tf_metrics, idf_metrics)
+    matrix = summarizer._create_sparse_matrix(sentences, 0.1, tf_metrics, idf_metrics)
+
+    assert numpy.allclose(expected, matrix.toarray())
+
+
+def test_vectorized_summarizer_returns_same_sentences():
+    document = build_document(
+        ("I am the sentence you like", "Do you like me?",),
+        ("This sentence is better than that above", "Are you kidding me?",),
+        ("I am the best sentence you will ever see", "The sentence you like is above",),
+    )
+    summarizer = LexRankSummarizer()
+    summarizer.stop_words = ("I", "am", "the", "you", "are", "me", "is", "than", "that", "this",)
+    expected = summarizer(document, 2)
+
+    summarizer.vectorized = True
+    sentences = summarizer(document, 2)
+
+    assert expected == sentences
+
+
+def test_continuous_matrix_keeps_cosine_weights():
+    summarizer = LexRankSummarizer()
+    sentences = [
+        ["this", "sentence", "is", "simple", "sentence"],
+        ["this", "is", "simple", "sentence", "yes", "is", "too", "too", "too"],
+        ["not", "every", "sentence", "makes", "me", "happy"],
+        ["yes"],
+        [],
+        ["every", "day", "is", "happy", "day"],
+    ]
+    tf_metrics = summarizer._compute_tf(sentences)
+    idf_metrics = summarizer._compute_idf(sentences)
+
+    expected = numpy.array([[summarizer.cosine_similarity(s1, s2, tf1, tf2, idf_metrics)
+        for s2, tf2 in zip(sentences, tf_metrics)] for s1, tf1 in zip(sentences, tf_metrics)])
+    degrees = expected.sum(axis=1)
+    degrees[degrees == 0] = 1.0
+    expected /= degrees[:, numpy.newaxis]
+
+    matrix = summarizer._create_sparse_matrix(sentences, 0.1, tf_metrics, idf_metrics, continuous=True)
+
+    assert numpy.allclose(expected, matrix.toarray())
+
+
+def test_continuous_matrix_products():
+    summarizer = LexRankSummarizer()
+    sentences = [
+        ["this", "sentence", "is", "simple", "sentence"],
+        ["this", "is", "simple", "sentence", "yes", "is", "too", "too", "too"],
+        ["not", "every", "sentence", "makes", "me", "happy"],
+        ["yes"],
+        [],
+        ["every", "day", "is", "happy", "day"],
+    ]
+    tf_metrics = summarizer._compute_tf(sentences)
+    idf_metrics = summarizer._compute_idf(sentences)
+    matrix = summarizer._create_sparse_matrix(sentences, 0.1, tf_metrics, idf_metrics, continuous=True)
+    vector = numpy.arange(1.0, 7.0)
+
+    assert numpy.allclose(matrix.toarray().dot(vector), matrix.dot(vector))
+    assert numpy.allclose(matrix.toarray().T.dot(vector), matrix.T.dot(vector))
+    assert numpy.allclose(matrix.toarray().T, matrix.T.toarray())
+
+
+def test_continuous_matrix_memory_grows_with_terms_only():
+    # half of the sentences share a common term so all their pairs are similar
+    sentences = [["common", "word%d" % i] if i % 2 else ["word%d" % i, "word%d" % (i + 1)] for i in range(500)]
+    summarizer = LexRankSummarizer()
+    tf_metrics = summarizer._compute_tf(sentences)
+    idf_metrics = summarizer._compute_idf(sentences)
+
+    matrix = summarizer._create_sparse_matrix(sentences, 0.1, tf_metrics, idf_metrics, continuous=True)
+
+    assert numpy.count_nonzero(matrix.toarray()) > 250 * 250
+    assert matrix.nnz <= 2 * 2 * len(sentences)
+
+
+def test_continuous_summarizer():
+    document = build_document(
+        ("I am the sentence you like", "Do you like me?",),
+        ("This sentence is better than that above", "Are you kidding me?",),
+        ("I am the best sentence you will ever see", "The sentence you like is above",),
+    )
+    summarizer = LexRankSummarizer()
+    summarizer.continuous = True
+
+    sentences = summarizer(document, 2)
+
+    assert len(sentences) == 2
+
+
+def test_power_method_stops_after_max_iterations():
+    # periodic chain never converges
+    matrix = numpy.array([
+        [0.0, 1.0],
+        [1.0, 0.0],
+    ])
+    initial_vector = numpy.array([0.9, 0.1])
+
+    with pytest.warns(UserWarning):
+        scores = LexRankSummarizer.power_method(matrix, LexRankSummarizer.epsilon, max_iterations=10,
+            initial_vector=initial_vector)
+
+    assert len(scores) == 2
+    assert initial_vector.tolist() == [0.9, 0.1]
+
+
+def test_power_method_is_capped_by_default():
+    # periodic chain never converges
+    matrix = numpy.array([
+        [0, 1],
+        [1, 0],
+    ])
+
+    with pytest.warns(UserWarning):
+        scores = LexRankSummarizer.power_method(matrix, LexRankSummarizer.epsilon, initial_vector=[0.9, 0.1])
+
+    assert len(scores) == 2
+
+
+def test_power_method_of_non_contiguous_integer_matrix():
+    matrix = numpy.asfortranarray(numpy.array([
+        [1, 1, 0],
+        [1, 1, 1],
+        [0, 1, 1],
+    ]))
+    expected = LexRankSummarizer.power_method(matrix.astype(numpy.float64), LexRankSummarizer.epsilon)
+
+    scores = LexRankSummarizer.power_method(matrix, LexRankSummarizer.epsilon)
+
+    assert numpy.allclose(expected, scores)
+
+
+def test_power_method_does_not_copy_dense_matrix():
+    tracemalloc = pytest.importorskip("tracemalloc")
+    matrix = numpy.full((500, 500), 1.0 / 500)
+
+    tracemalloc.start()
+    try:
+        LexRankSummarizer.power_method(matrix, LexRankSummarizer.epsilon)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    assert peak < matrix.nbytes / 10
+
+
+@pytest.mark.parametrize("sparse_format", ["csr", "csc", "coo"])
+def test_power_method_of_sparse_matrix(sparse_format):
+    sparse = pytest.importorskip("scipy.sparse")
+    matrix = numpy.array([
+        [1, 1, 0, 0],
+        [1, 1, 1, 0],
+        [0, 1, 1, 1],
+        [0, 0, 2, 1],
+    ])
+    expected = LexRankSummarizer.power_method(matrix.astype(numpy.float64), LexRankSummarizer.epsilon)
+
+    scores = LexRankSummarizer.power_method(sparse.csr_matrix(matrix).asformat(sparse_format),
+        LexRankSummarizer.epsilon)
+
+    assert numpy.allclose(expected, scores)
+
+
+def test_power_method_with_wrong_initial_vector():
+    matrix = numpy.array([
+        [0.5, 0.5],
+        [0.5, 0.5],
+    ])
+
+    with pytest.raises(ValueError):
+        LexRankSummarizer.power_method(matrix, LexRankSummarizer.epsilon, initial_vector=[1.0])
+
+
+def test_convergence_report():
+    document = build_document(
+        ("I am the sentence you like", "Do you like me?",),
+        ("This sentence is better than that above", "Are you kidding me?",),
+    )
+    summarizer = LexRankSummarizer()
+    summarizer(document, 2)
+
+    report = summarizer.convergence_report
+    assert report.converged
+    assert report.iterations > 0
+    assert report.residual <= summarizer.epsilon
+    assert report.elapsed_time >= 0.0
+
+
+def test_candidate_pairs_contain_same_sentences():
+    summarizer = LexRankSummarizer()
+    sentences = [
+        ["this", "sentence", "is", "simple"],
+        ["completely", "different", "words", "here"],
+        ["this", "sentence", "is", "simple"],
+        [],
+    ]
+    tf_metrics = summarizer._compute_tf(sentences)
+    inverted_index = summarizer._create_inverted_index(sentences)
+    idf_metrics = summarizer._compute_idf(sentences, inverted_index)
+    tf_idf = summarizer._create_tf_idf_matrix(sentences, tf_metrics, idf_metrics, inverted_index)
+
+    pairs = summarizer._find_candidate_pairs(tf_idf, *summarizer._get_lsh_parameters()).tolist()
+
+    assert 0*4 + 2 in pairs
+    assert all(p // 4 < p % 4 for p in pairs)
+
+
+def test_approximate_matrix_with_all_pairs_is_exact():
+    summarizer = LexRankSummarizer()
+    summarizer.lsh_bands = 200
+    summarizer.lsh_rows = 1
+    sentences = [
+        ["this", "sentence", "is", "simple", "sentence"],
+        ["this", "is", "simple", "sentence", "yes", "is", "too", "too", "too"],
+        ["not", "every", "sentence", "makes", "me", "happy"],
+        ["yes"],
+        [],
+        ["every", "day", "is", "happy", "day"],
+    ]
+    tf_metrics = summarizer._compute_tf(sentences)
+    idf_metrics = summarizer._compute_idf(sentences)
+
+    expected = summarizer._create_matrix(sentences, 0.1, tf_metrics, idf_metrics)
+    matrix = summarizer._create_sparse_matrix(sentences, 0.1, tf_metrics, idf_metrics,
+        lsh_parameters=summarizer._get_lsh_parameters())
+
+    assert numpy.allclose(expected, matrix.toarray())
+
+
+def test_approximation_recall():
+    parser = PlaintextParser.from_string(
+        load_resource("articles/prevko_cz_1.txt"),
+        Tokenizer("czech")
+    )
+    summarizer = LexRankSummarizer(stem_word)
+    summarizer.stop_words = get_stop_words("czech")
+
+    recall = summarizer.approximation_recall([parser.document])
+    assert 0.0 < recall <= 1.0
+
+    # almost every pair sharing a term is a candidate
+    summarizer.lsh_bands = 200
+    summarizer.lsh_rows = 1
+    assert summarizer.approximation_recall([parser.document]) > 0.9
+
+    summarizer.approximate = True
+    sentences = summarizer(parser.document, 20)
+    assert len(sentences) == 20
+
+
+def test_approximation_recall_ignores_similarity_of_sentence_with_itself():
+    document = build_document(
+        ("Both sentences are same", "Both sentences are same"),
+        ("Another one here", "Nothing in common", "Quite different words"),
+    )
+    summarizer = LexRankSummarizer()
+    summarizer.lsh_bands = 0
+
+    assert summarizer.approximation_recall([document]) == 0.0
+
+
+def test_candidate_pairs_of_long_document():
+    parser = PlaintextParser.from_string(
+        load_resource("articles/svd_converges.txt"),
+        Tokenizer("english")
+    )
+    summarizer = LexRankSummarizer()
+    summarizer.stop_words = get_stop_words("english")
+    sentences = summarizer._stem_content_words(parser.document, summarizer.stop_words)
+    tf_metrics = summarizer._compute_tf(sentences)
+    inverted_index = summarizer._create_inverted_index(sentences)
+    idf_metrics = summarizer._compute_idf(sentences, inverted_index)
+    tf_idf = summarizer._create_tf_idf_matrix(sentences, tf_metrics, idf_metrics, inverted_index)
+
+    pairs = summarizer._find_candidate_pairs(tf_idf, *summarizer._get_lsh_parameters())
+
+    sentences_count = len(sentences)
+    assert sentences_count > 1000
+    assert len(pairs) < 0.1 * sentences_count * (sentences_count - 1) / 2
+    # every band contributes at most `lsh_max_bucket_size` - 1 pairs per sentence
+    assert len(pairs) <= summarizer.lsh_bands * sentences_count * (summarizer.lsh_max_bucket_size - 1) / 2
+    assert len(numpy.unique(pairs)) == len(pairs)
+
+
+def test_approximation_recall_of_empty_corpus():
+    summarizer = LexRankSummarizer()
+
+    assert summarizer.approximation_recall([build_document()]) == 1.0
+
+
+_APPROXIMATE_RANKING_SCRIPT = """
+import json, sys
+from sumy.summarizers.lex_rank import LexRankSummarizer
+from sumy.summarizers._power_method import power_iteration
+
+summarizer = LexRankSummarizer()
+sentences = json.loads(sys.stdin.read())
+tf_metrics = summarizer._compute_tf(sentences)
+idf_metrics = summarizer._compute_idf(sentences)
+matrix = summarizer._create_sparse_matrix(sentences, summarizer.threshold, tf_metrics, idf_metrics,
+    lsh_parameters=summarizer._get_lsh_parameters())
+scores, _ = power_iteration(matrix, summarizer.epsilon, summarizer.max_iterations, normalize=True)
+print(json.dumps([matrix.nnz, sorted(range(len(scores)), key=lambda i: -scores[i])[:20]]))
+"""
+
+
+def test_approximate_ranking_does_not_depend_on_hashing_of_strings():
+    parser = PlaintextParser.from_string(
+        load_resource("articles/svd_converges.txt"),
+        Tokenizer("english")
+    )
+    summarizer = LexRankSummarizer()
+    summarizer.stop_words = get_stop_words("english")
+    sentences = json.dumps(summarizer._stem_content_words(parser.document, summarizer.stop_words))
+
+    def rank_sentences(hash_seed):
+        environment = dict(os.environ, PYTHONHASHSEED=hash_seed,
+            PYTHONPATH=os.path.dirname(os.path.dirname(os.path.abspath(sumy.__file__))))
+        process = subprocess.Popen([sys.executable, "-c", _APPROXIMATE_RANKING_SCRIPT], env=environment,
+            stdin=subprocess.PIPE, stdout=subprocess.PIPE)
+        output, _ = process.communicate(sentences.encode("utf-8"))
+        assert process.returncode == 0
+        return json.loads(output.decode("utf-8"))
+
+    assert rank_sentences("1") == rank_sentences("2")
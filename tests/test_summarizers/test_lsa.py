@@ -2,6 +2,7 @@
 
 from __future__ import absolute_import, division, print_function, unicode_literals
 
+import numpy
 import pytest
 
 import sumy.summarizers.lsa as lsa_module
@@ -11,7 +12,7 @@ from sumy.nlp.tokenizers import Tokenizer
 from sumy.parsers.plaintext import PlaintextParser
 from sumy.summarizers.lsa import LsaSummarizer
 from sumy.utils import get_stop_words
-from ..utils import build_document, load_resource
+from ..utils import build_document, build_document_from_string, load_resource
 
 
 def test_numpy_not_installed():
@@ -42,6 +43,42 @@ def test_dictionary_without_stop_words():
     assert expected == frozenset(dictionary.keys())
 
 
+def test_every_word_is_stemmed_once():
+    stemmed_words = []
+
+    def stemmer(word):
+        stemmed_words.append(word)
+        return word[:4]
+
+    summarizer = LsaSummarizer(stemmer)
+    summarizer.stop_words = ["stop"]
+    document = build_document_from_string("""
+        # Heading words
+        Some relevant sentence stop
+        Some more relevant wordy sentences
+    """)
+
+    dictionary, sentences_terms = summarizer._encode_document(document)
+
+    assert sorted(stemmed_words) == sorted(frozenset(w.lower() for w in document.words))
+    assert frozenset(dictionary.keys()) == frozenset(["head", "word", "some", "rele", "sent", "more"])
+    assert sentences_terms == [
+        [dictionary["some"], dictionary["rele"], dictionary["sent"]],
+        [dictionary["some"], dictionary["more"], dictionary["rele"], dictionary["word"], dictionary["sent"]],
+    ]
+
+
+def test_stop_words_stems_counted_when_shared():
+    summarizer = LsaSummarizer(lambda w: w[:4])
+    summarizer.stop_words = ["stopped"]
+    document = build_document(("stopped stopping",))
+
+    dictionary, sentences_terms = summarizer._encode_document(document)
+
+    assert dictionary == {"stop": 0}
+    assert sentences_terms == [[0, 0]]
+
+
 def test_empty_document():
     document = build_document()
     summarizer = LsaSummarizer()
@@ -115,3 +152,83 @@ def test_issue_5_svd_converges():
 
     sentences = summarizer(parser.document, 20)
     assert len(sentences) == 20
+
+
+def test_unknown_svd_backend():
+    summarizer = LsaSummarizer()
+    summarizer.svd_backend = "magic"
+
+    with pytest.raises(ValueError):
+        summarizer(build_document(("I am the sentence you like",)), 10)
+
+
+def test_scipy_not_installed_for_lanczos_svd(monkeypatch):
+    summarizer = LsaSummarizer()
+    summarizer.svd_backend = "lanczos"
+
+    monkeypatch.setattr(lsa_module, "truncated_singular_value_decomposition", None)
+
+    with pytest.raises(ValueError):
+        summarizer(build_document(("I am the sentence you like",)), 10)
+
+
+@pytest.mark.parametrize("svd_backend", ["randomized", "lanczos"])
+def test_truncated_svd_returns_top_singular_values(svd_backend):
+    random_state = numpy.random.RandomState(42)
+    matrix = random_state.poisson(0.3, size=(60, 40)).astype(float)
+    summarizer = LsaSummarizer()
+    summarizer.svd_backend = svd_backend
+    summarizer.svd_dimensions = 5
+
+    u, sigma, v = summarizer._compute_svd(matrix)
+    expected_sigma = numpy.linalg.svd(matrix, compute_uv=False)[:5]
+
+    assert u.shape == (60, 5)
+    assert v.shape == (5, 40)
+    assert sigma.tolist() == pytest.approx(expected_sigma.tolist(), rel=1e-2)
+
+
+@pytest.mark.parametrize("svd_backend", ["randomized", "lanczos"])
+def test_article_example_with_truncated_svd(svd_backend):
+    parser = PlaintextParser.from_string(
+        load_resource("articles/prevko_cz_1.txt"),
+        Tokenizer("czech")
+    )
+    summarizer = LsaSummarizer(Stemmer("czech"))
+    summarizer.stop_words = get_stop_words("czech")
+    summarizer.svd_backend = svd_backend
+    summarizer.svd_dimensions = 10
+
+    sentences = summarizer(parser.document, 20)
+    assert len(sentences) == 20
+
+
+def test_sparse_term_frequency_is_same_as_dense(monkeypatch):
+    document = build_document(
+        ("I am the sentence you like", "Do you like me too",),
+        ("This sentence is better than that above", "Are you kidding me",)
+    )
+    summarizer = LsaSummarizer()
+    dictionary, sentences_terms = summarizer._encode_document(document)
+
+    matrix = summarizer._compute_term_frequency(summarizer._create_matrix(sentences_terms, dictionary))
+
+    monkeypatch.setattr(lsa_module, "sparse", None)
+    dense_matrix = summarizer._create_matrix(sentences_terms, dictionary)
+
+    assert isinstance(dense_matrix, numpy.ndarray)
+    dense_matrix = summarizer._compute_term_frequency(dense_matrix)
+    assert numpy.allclose(dense_matrix, matrix.toarray())
+
+
+def test_rank_one_updated_matrix_products():
+    sparse = pytest.importorskip("scipy.sparse")
+    matrix = sparse.csr_matrix(numpy.array([[1.0, 0.0, 2.0], [0.0, 0.0, 3.0]]))
+    updated = lsa_module._RankOneUpdatedMatrix(matrix, numpy.ones(2), numpy.array([0.4, 0.0, 0.4]))
+    dense = updated.toarray()
+    vector = numpy.array([1.0, 2.0, 3.0])
+
+    assert numpy.allclose(dense, [[1.4, 0.0, 2.4], [0.4, 0.0, 3.4]])
+    assert numpy.allclose(updated.dot(vector), dense.dot(vector))
+    assert numpy.allclose(updated.dot(numpy.eye(3)), dense)
+    assert numpy.allclose(updated.T.dot(numpy.ones(2)), dense.T.dot(numpy.ones(2)))
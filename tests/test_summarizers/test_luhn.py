@@ -131,3 +131,23 @@ def test_real_example():
         "Jednalo se o případ chlapce v 6. třídě, který měl problémy s učením.",
         "Připadal si, že je mezi malými dětmi a realizoval se tím, že si ve třídě o rok mladších dětí budoval vedoucí pozici.",
     ]
+
+
+def test_every_word_is_stemmed_once():
+    stemmed_words = []
+
+    def stemmer(word):
+        stemmed_words.append(word)
+        return word
+
+    document = build_document(
+        ("Dog and cat.", "Dog chases cat."),
+        ("Cat runs away from the dog.", "Dog and cat are friends now."),
+    )
+    summarizer = LuhnSummarizer(stemmer)
+    summarizer.stop_words = ("and", "the")
+
+    returned = summarizer(document, 2)
+
+    assert len(returned) == 2
+    assert sorted(stemmed_words) == sorted(frozenset(w.lower() for w in document.words))
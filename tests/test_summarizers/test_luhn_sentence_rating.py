@@ -122,3 +122,15 @@ def test_three_chunks_with_3_gap(summarizer):
     significant_stems = ("w",)
 
     assert summarizer.rate_sentence(sentence, significant_stems) == 1
+
+
+def test_significant_words_are_set(summarizer):
+    words = summarizer._get_significant_words(("wa", "wb", "wa", "wb", "wc"))
+
+    assert words == frozenset(("wa", "wb"))
+
+
+def test_chunk_ratings_from_significance(summarizer):
+    significance = [0, 1, 0, 1, 0, 0, 0, 0, 1, 1, 1, 0, 0, 1, 0]
+
+    assert summarizer._get_chunk_ratings(significance) == (4/3, 16/6)
@@ -3,6 +3,9 @@
 from __future__ import absolute_import
 from __future__ import division, print_function, unicode_literals
 
+import pytest
+
+import sumy.summarizers.reduction as reduction_module
 from sumy.summarizers.reduction import ReductionSummarizer
 from sumy.nlp.stemmers import Stemmer
 from sumy._compat import to_unicode
@@ -93,3 +96,52 @@ def test_sentences_rating():
     assert len(ratings) == 3
     assert ratings[document.sentences[1]] > ratings[document.sentences[0]]
     assert ratings[document.sentences[0]] > ratings[document.sentences[2]]
+
+
+def test_scipy_not_installed_for_vectorized_summarizer(monkeypatch):
+    summarizer = ReductionSummarizer()
+    summarizer.vectorized = True
+
+    monkeypatch.setattr(reduction_module, "sparse", None)
+
+    with pytest.raises(ValueError):
+        summarizer(build_document(), 10)
+
+
+@pytest.mark.parametrize("block_size, workers", [
+    (None, 1),
+    (1, 1),
+    (2, 3),
+])
+def test_vectorized_ratings_are_same_as_pairwise_ratings(block_size, workers):
+    document = build_document(
+        ("I am that 1. sentence", "And I am 2. sentence - winning sentence", "Single"),
+        ("And I am 3. sentence - winner is my 2nd name", "Single", "a c e g"),
+        ("a b c d e f g", "b d f", "I am"),
+    )
+    summarizer = ReductionSummarizer()
+    summarizer.stop_words = ["I", "am", "and", "that"]
+    expected = summarizer.rate_sentences(document)
+
+    summarizer.vectorized = True
+    summarizer.block_size = block_size
+    summarizer.workers = workers
+    ratings = summarizer.rate_sentences(document)
+
+    assert ratings.keys() == expected.keys()
+    for sentence in document.sentences:
+        assert ratings[sentence] == pytest.approx(expected[sentence])
+
+
+@pytest.mark.parametrize("sentence", ["I am one sentence", "I am", ""])
+def test_vectorized_ratings_of_single_sentence(sentence):
+    document = build_document((sentence,))
+    summarizer = ReductionSummarizer()
+    summarizer.stop_words = ("I", "am",)
+    expected = summarizer.rate_sentences(document)
+
+    summarizer.vectorized = True
+    ratings = summarizer.rate_sentences(document)
+
+    assert ratings == expected
+    assert summarizer(document, 10) == document.sentences
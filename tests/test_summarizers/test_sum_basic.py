@@ -6,7 +6,9 @@ import pytest
 
 from sumy.models.dom._sentence import Sentence
 from sumy.nlp.tokenizers import Tokenizer
+import sumy.summarizers.sum_basic as sum_basic_module
 from sumy.summarizers.sum_basic import SumBasicSummarizer
+from sumy.summarizers._summarizer import UNRANKED_RATING
 from sumy.nlp.stemmers import Stemmer
 from ..utils import build_document
 
@@ -168,3 +170,72 @@ def test_compute_ratings():
     assert ratings[s0] == 0
     assert ratings[s1] == -2
     assert ratings[s2] == -1
+
+
+def test_compute_ratings_stopped_early():
+    summarizer = _build_summarizer(EMPTY_STOP_WORDS)
+
+    s0 = Sentence("one two three", Tokenizer("english"))
+    s1 = Sentence("one two four", Tokenizer("english"))
+    s2 = Sentence("three five six", Tokenizer("english"))
+    document = build_document([s0, s1, s2])
+
+    ratings = summarizer._compute_ratings(document.sentences, 2)
+    assert ratings[s0] == 0
+    assert ratings[s1] == UNRANKED_RATING
+    assert ratings[s2] == -1
+
+    assert summarizer(document, 2) == (s0, s2)
+    assert summarizer(document, "67%") == (s0, s2)
+
+
+def _compute_ratings_by_linear_search(summarizer, sentences):
+    word_freq = summarizer._compute_tf(sentences)
+    sentences_list = list(sentences)
+    sentences_as_words = [summarizer._get_content_words_in_sentence(s) for s in sentences]
+    ratings = {}
+
+    while sentences_list:
+        best_sentence_index = summarizer._find_index_of_best_sentence(word_freq, sentences_as_words)
+        ratings[sentences_list.pop(best_sentence_index)] = -len(ratings)
+        summarizer._update_tf(word_freq, sentences_as_words.pop(best_sentence_index))
+
+    return ratings
+
+
+def test_heap_ratings_are_same_as_linear_search_ratings():
+    summarizer = _build_summarizer(("the", "and", "is"))
+    document = build_document(
+        ("The quick brown fox jumps over the lazy dog.", "I am the sentence you like and I like you."),
+        ("The fox is quick and the dog is lazy.", "Jumps over everything.", "Brown dog.", "The and."),
+        ("Fox.", "Dog.", "Quick quick quick fox and the lazy dog.", "Fox."),
+        ("Dog fox.", "I like the brown lazy dog and the quick fox."),
+    )
+
+    ratings = summarizer._compute_ratings(document.sentences)
+
+    assert ratings == _compute_ratings_by_linear_search(summarizer, document.sentences)
+
+
+@pytest.mark.parametrize("limit", [None, 3])
+def test_vectorized_ratings_are_same_as_ratings(limit):
+    summarizer = _build_summarizer(("the", "and", "is"))
+    document = build_document(
+        ("The quick brown fox jumps over the lazy dog.", "I am the sentence you like and I like you."),
+        ("The fox is quick and the dog is lazy.", "Jumps over everything.", "Brown dog.", "The and."),
+        ("Fox.", "Dog.", "Quick quick quick fox and the lazy dog.", "Fox."),
+    )
+
+    ratings = summarizer._compute_ratings_vectorized(document.sentences, limit)
+
+    assert ratings == summarizer._compute_ratings(document.sentences, limit)
+
+
+def test_numpy_not_installed_for_vectorized_summarizer(monkeypatch):
+    summarizer = _build_summarizer(EMPTY_STOP_WORDS)
+    summarizer.vectorized = True
+
+    monkeypatch.setattr(sum_basic_module, "numpy", None)
+
+    with pytest.raises(ValueError):
+        summarizer(build_document(), 10)
@@ -0,0 +1,182 @@
+# -*- coding: utf-8 -*-
+
+from __future__ import absolute_import
+from __future__ import division, print_function, unicode_literals
+
+import random
+
+import pytest
+
+from collections import namedtuple
+from sumy.summarizers._summarizer import AbstractSummarizer
+from sumy.summarizers.kl import KLSummarizer
+from sumy.summarizers.lex_rank import LexRankSummarizer
+from sumy.summarizers.lsa import LsaSummarizer
+from sumy.summarizers.luhn import LuhnSummarizer
+from sumy.summarizers.reduction import ReductionSummarizer
+from sumy.summarizers.sum_basic import SumBasicSummarizer
+from sumy.summarizers.text_rank import TextRankSummarizer
+from sumy.utils import ItemsCount
+from ..utils import build_document
+
+
+def _get_best_sentences_by_sorting(sentences, count, ratings):
+    infos = sorted(enumerate(sentences), key=lambda i: ratings[i[1]], reverse=True)
+    infos = ItemsCount(count)(infos)
+    return tuple(s for o, s in sorted(infos))
+
+
+@pytest.mark.parametrize("count", [0, 1, 3, 10, 99, 100, 1000, "7", "1%", "33%", "100%"])
+def test_best_sentences_are_same_as_sorted_ones(count):
+    rnd = random.Random(count)
+    sentences = ["sentence %d" % i for i in range(100)]
+    # a lot of ties
+    ratings = dict((s, rnd.randint(0, 10)) for s in sentences)
+
+    best_sentences = AbstractSummarizer._get_best_sentences(sentences, count, ratings)
+
+    assert best_sentences == _get_best_sentences_by_sorting(sentences, count, ratings)
+
+
+def test_best_sentences_with_custom_count():
+    sentences = ["a", "b", "c", "d"]
+    ratings = {"a": 1, "b": 4, "c": 3, "d": 2}
+
+    def count(infos):
+        return [i for i in infos if i.rating > 2]
+
+    assert AbstractSummarizer._get_best_sentences(sentences, count, ratings) == ("b", "c")
+
+
+def test_best_sentences_rated_by_function():
+    sentences = ["aaa", "b", "cc", "dddd"]
+
+    best_sentences = AbstractSummarizer._get_best_sentences(sentences, "50%", lambda s, factor: factor*len(s), -1)
+
+    assert best_sentences == ("b", "cc")
+
+
+def test_summarizers_share_stems_of_document():
+    stemmed_words = []
+
+    def stemmer(word):
+        stemmed_words.append(word)
+        return word
+
+    document = build_document(
+        ("The quick brown fox jumps over the lazy dog.", "The fox is quick and the dog is lazy."),
+        ("Quick quick fox and the lazy dog.", "I like the brown lazy dog and the quick fox."),
+    )
+    stop_words = ("the", "and", "is")
+
+    summarizer_classes = (LexRankSummarizer, TextRankSummarizer, ReductionSummarizer,
+        LuhnSummarizer, LsaSummarizer, SumBasicSummarizer, KLSummarizer)
+    for summarizer_class in summarizer_classes:
+        summarizer = summarizer_class(stemmer)
+        # Luhn uses different stop-words than the others
+        summarizer.stop_words = ("the",) if summarizer_class is LuhnSummarizer else stop_words
+        summarizer(document, 2)
+
+    assert sorted(stemmed_words) == sorted(frozenset(w.lower() for w in document.words))
+
+
+def test_kl_summarizer_does_not_stem_words():
+    stemmed_words = []
+
+    def stemmer(word):
+        stemmed_words.append(word)
+        return word
+
+    document = build_document(("The quick brown fox.", "The lazy dog."), ("The fox and the dog.",))
+    summarizer = KLSummarizer(stemmer)
+    summarizer.stop_words = ("the", "and")
+
+    assert len(summarizer(document, 2)) == 2
+    assert stemmed_words == []
+
+
+@pytest.mark.parametrize("summarizer_class", [LexRankSummarizer, TextRankSummarizer, ReductionSummarizer,
+    LuhnSummarizer, LsaSummarizer, SumBasicSummarizer, KLSummarizer])
+def test_summarizers_of_document_without_encoded_views(summarizer_class):
+    document = build_document(
+        ("The quick brown fox jumps over the lazy dog.", "The fox is quick and the dog is lazy."),
+        ("Quick quick fox and the lazy dog.", "I like the brown lazy dog and the quick fox."),
+    )
+    # any document-like object, not only ObjectDocumentModel
+    Document = namedtuple("Document", ("sentences", "headings", "words"))
+    plain_document = Document(document.sentences, document.headings, document.words)
+    summarizer = summarizer_class()
+    summarizer.stop_words = ("the", "and", "is")
+
+    assert summarizer(plain_document, 2) == summarizer(document, 2)
+
+
+def _build_overriding_document():
+    return build_document(
+        ("The quick brown fox jumps over the lazy dog.", "The fox is quick and the dog is lazy."),
+        ("Quick quick fox and the lazy dog.", "I like the brown lazy dog and the quick fox."),
+    )
+
+
+@pytest.mark.parametrize("summarizer_class", [LexRankSummarizer, TextRankSummarizer, ReductionSummarizer,
+    LuhnSummarizer, LsaSummarizer, SumBasicSummarizer, KLSummarizer])
+def test_summarizers_use_overridden_normalize_word(summarizer_class):
+    normalized_words = []
+
+    class Summarizer(summarizer_class):
+        @staticmethod
+        def normalize_word(word):
+            normalized_words.append(word)
+            return summarizer_class.normalize_word(word)
+
+    document = _build_overriding_document()
+    summarizer = Summarizer()
+    summarizer.stop_words = ("the", "and", "is")
+    expected_summarizer = summarizer_class()
+    expected_summarizer.stop_words = ("the", "and", "is")
+    del normalized_words[:]
+
+    assert summarizer(document, 2) == expected_summarizer(document, 2)
+    assert frozenset(normalized_words) >= frozenset(document.words)
+
+
+@pytest.mark.parametrize("summarizer_class", [LexRankSummarizer, TextRankSummarizer, ReductionSummarizer,
+    LuhnSummarizer, LsaSummarizer, SumBasicSummarizer])
+def test_summarizers_use_overridden_stem_word(summarizer_class):
+    stemmed_words = []
+
+    class Summarizer(summarizer_class):
+        def stem_word(self, word):
+            stemmed_words.append(word)
+            return super(Summarizer, self).stem_word(word)
+
+    document = _build_overriding_document()
+    summarizer = Summarizer()
+    summarizer.stop_words = ("the", "and", "is")
+    expected_summarizer = summarizer_class()
+    expected_summarizer.stop_words = ("the", "and", "is")
+
+    summary = summarizer(document, 2)
+    # the view built by the overridden method is not shared
+    assert document._encoded_documents == {}
+    assert summary == expected_summarizer(document, 2)
+    assert "fox" in stemmed_words
+
+
+@pytest.mark.parametrize("summarizer_class", [LexRankSummarizer, TextRankSummarizer, ReductionSummarizer])
+def test_summarizers_use_overridden_to_words_set(summarizer_class):
+    sentences = []
+
+    class Summarizer(summarizer_class):
+        def _to_words_set(self, sentence):
+            sentences.append(sentence)
+            return super(Summarizer, self)._to_words_set(sentence)
+
+    document = _build_overriding_document()
+    summarizer = Summarizer()
+    summarizer.stop_words = ("the", "and", "is")
+    expected_summarizer = summarizer_class()
+    expected_summarizer.stop_words = ("the", "and", "is")
+
+    assert summarizer(document, 2) == expected_summarizer(document, 2)
+    assert sentences == list(document.sentences)
@@ -7,6 +7,7 @@ import pytest
 
 import sumy.summarizers.text_rank as text_rank_module
 from sumy.summarizers.text_rank import TextRankSummarizer
+from sumy.summarizers._power_method import power_iteration
 from sumy.nlp.stemmers import Stemmer
 from sumy._compat import to_unicode
 from ..utils import build_document
@@ -24,6 +25,16 @@ def test_numpy_not_installed():
     text_rank_module.numpy = numpy
 
 
+def test_scipy_not_installed_for_vectorized_summarizer(monkeypatch):
+    summarizer = TextRankSummarizer()
+    summarizer.vectorized = True
+
+    monkeypatch.setattr(text_rank_module, "sparse", None)
+
+    with pytest.raises(ValueError):
+        summarizer(build_document(), 10)
+
+
 def test_empty_document():
     document = build_document()
     summarizer = TextRankSummarizer(Stemmer("english"))
@@ -107,13 +118,16 @@ def test_sentences_rating():
     (["a", "b"], [0.49999995750000414, 0.49999995750000414]),
     (["b", "a"], [0.49999995750000414, 0.49999995750000414]),
 ])
-def test_rating_with_zero_or_single_words_in_sentences(sentences, expected_ratings):
+@pytest.mark.parametrize("vectorized, implicit_teleport", [(False, False), (True, False), (False, True)])
+def test_rating_with_zero_or_single_words_in_sentences(sentences, expected_ratings, vectorized, implicit_teleport):
     """
     This is an edge-case test when the sentence(s) have only one word or even zero words.
     This test makes me sure the logic will not break when such a case is encountered.
     """
     document = build_document(sentences)
     summarizer = TextRankSummarizer()
+    summarizer.vectorized = vectorized
+    summarizer.implicit_teleport = implicit_teleport
 
     ratings = summarizer.rate_sentences(document)
 
@@ -121,3 +135,74 @@ def test_rating_with_zero_or_single_words_in_sentences(sentences, expected_ratin
         document.sentences[0]: pytest.approx(expected_ratings[0]),
         document.sentences[1]: pytest.approx(expected_ratings[1]),
     }
+
+
+def test_power_method_with_warm_start():
+    document = build_document(
+        ("I am the sentence you like", "Do you like me?",),
+        ("This sentence is better than that above", "Are you kidding me?",),
+    )
+    summarizer = TextRankSummarizer()
+    ratings = summarizer.rate_sentences(document)
+    iterations = summarizer.convergence_report.iterations
+    assert summarizer.convergence_report.converged
+
+    matrix = summarizer._create_matrix(document)
+    ranks = summarizer.power_method(matrix, summarizer.epsilon, initial_vector=[ratings[s] for s in document.sentences])
+
+    assert ranks.tolist() == pytest.approx([ratings[s] for s in document.sentences], abs=summarizer.epsilon)
+    assert iterations > 1
+
+    _, cold_report = power_iteration(matrix, summarizer.epsilon)
+    _, warm_report = power_iteration(matrix, summarizer.epsilon, initial_vector=[ratings[s] for s in document.sentences])
+    assert warm_report.iterations < cold_report.iterations
+
+
+def test_power_method_max_iterations():
+    document = build_document(
+        ("I am the sentence you like", "Do you like me?",),
+        ("This sentence is better than that above", "Are you kidding me?",),
+    )
+    summarizer = TextRankSummarizer()
+    summarizer.max_iterations = 1
+
+    with pytest.warns(UserWarning):
+        summarizer.rate_sentences(document)
+
+    assert summarizer.convergence_report.iterations == 1
+    assert not summarizer.convergence_report.converged
+
+
+def test_sparse_weights_are_same_as_pairwise_weights():
+    sentences_as_words = [
+        ["a", "c", "e", "g"],
+        ["a", "b", "c", "d", "e", "f", "g", "a"],
+        ["b", "d", "f"],
+        ["a"],
+        ["a"],
+        ["h"],
+        [],
+        ["h", "h"],
+    ]
+    summarizer = TextRankSummarizer()
+
+    weights = summarizer._create_sparse_weights(sentences_as_words).toarray()
+
+    for i, words_i in enumerate(sentences_as_words):
+        for j, words_j in enumerate(sentences_as_words):
+            assert weights[i, j] == summarizer._rate_sentences_edge(words_i, words_j)
+
+
+def test_implicit_teleport_ratings_are_same_as_dense_ratings():
+    document = build_document(
+        ("I am the sentence you like", "Do you like me?",),
+        ("This sentence is better than that above", "Are you kidding me?",),
+        ("I am the best sentence you will ever see", "The sentence you like is above", "Nothing",),
+    )
+    summarizer = TextRankSummarizer()
+    expected = summarizer.rate_sentences(document)
+
+    summarizer.implicit_teleport = True
+    ratings = summarizer.rate_sentences(document)
+
+    assert ratings == {s: pytest.approx(r) for s, r in expected.items()}